@@ -1,39 +1,108 @@
+import os
+
 from flask import Flask
+from jinja2 import FileSystemBytecodeCache
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from werkzeug.utils import import_string
 
-from app.api import api_bp
-from app.auth import auth_bp
-from app.config import Config
+from app.config import Config, config_values
 from app.extensions import db, login_manager, migrate
-from app.jobs.scheduler import start_scheduler
-from app.schema_migrations import migrate_keywords_into_tags_and_drop_column
-from app.web import web_bp
+
+BLUEPRINTS = ("app.auth:auth_bp", "app.web:web_bp", "app.api:api_bp")
+TEMPLATE_GLOBALS = {"app_name": "LinkLoom"}
+
+
+def _engine_options(config) -> dict:
+    url = make_url(config["SQLALCHEMY_DATABASE_URI"])
+    if url.get_backend_name() == "sqlite" and url.database in {None, "", ":memory:"}:
+        # Flask-SQLAlchemy pins in-memory SQLite to a StaticPool, which does not
+        # accept sizing arguments.
+        return {}
+    return {
+        "pool_size": config["DB_POOL_SIZE"],
+        "max_overflow": config["DB_MAX_OVERFLOW"],
+        "pool_timeout": config["DB_POOL_TIMEOUT"],
+        "pool_recycle": config["DB_POOL_RECYCLE"],
+        "pool_pre_ping": True,
+    }
+
+
+def _warm_connection_pool(app: Flask) -> None:
+    pool_size = app.config["SQLALCHEMY_ENGINE_OPTIONS"].get("pool_size")
+    if not pool_size:
+        return
+    with app.app_context():
+        if db.engine.dialect.name == "sqlite":
+            return
+        connections = [db.engine.connect() for _ in range(pool_size)]
+        for connection in connections:
+            connection.execute(text("SELECT 1"))
+            connection.close()
+
+
+def _preload_templates(app: Flask) -> None:
+    cache_dir = app.config.get("TEMPLATE_CACHE_DIR")
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(cache_dir)
+    for name in app.jinja_env.list_templates(extensions=["html"]):
+        app.jinja_env.get_template(name)
 
 
 def create_app(config_object=Config):
     app = Flask(__name__, template_folder="../templates", static_folder="../static")
-    app.config.from_object(config_object)
+    app.config.update(config_values(config_object))
+    app.config.setdefault("SQLALCHEMY_ENGINE_OPTIONS", _engine_options(app.config))
 
     db.init_app(app)
     migrate.init_app(app, db)
     login_manager.init_app(app)
 
-    app.register_blueprint(auth_bp)
-    app.register_blueprint(web_bp)
-    app.register_blueprint(api_bp)
+    from app.services.content import configure_http_client
+
+    configure_http_client(
+        app.config["HTTP_MAX_CONNECTIONS"],
+        app.config["HTTP_MAX_KEEPALIVE_CONNECTIONS"],
+    )
+
+    for import_path in BLUEPRINTS:
+        app.register_blueprint(import_string(import_path))
+    # Sort and compile the routing rules now instead of on the first request.
+    app.url_map.update()
+    # API payloads are built as dicts in a fixed order already; sorting keys
+    # on every response only costs serialization time.
+    app.json.sort_keys = False
+    if not app.testing:
+        _preload_templates(app)
 
     @app.cli.command("init-db")
     def init_db_command():
+        from app.schema_migrations import (
+            create_missing_indexes,
+            migrate_keywords_into_tags_and_drop_column,
+        )
+
         db.create_all()
+        create_missing_indexes()
         migrate_keywords_into_tags_and_drop_column()
         print("Initialized LinkLoom database.")
 
     @app.context_processor
     def inject_globals():
-        return {"app_name": "LinkLoom"}
+        return TEMPLATE_GLOBALS
 
-    with app.app_context():
-        db.create_all()
-        migrate_keywords_into_tags_and_drop_column()
+    if app.config.get("AUTO_MIGRATE", True):
+        from app.schema_migrations import create_missing_indexes
+
+        with app.app_context():
+            db.create_all()
+            create_missing_indexes()
+
+    _warm_connection_pool(app)
+
+    if app.config.get("SCHEDULER_ENABLED", True):
+        from app.jobs.scheduler import start_scheduler
 
-    start_scheduler(app)
+        start_scheduler(app)
     return app
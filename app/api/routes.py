@@ -1,8 +1,12 @@
 from __future__ import annotations
 
-import hashlib
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 
 from flask import current_app, g, jsonify, request
+from sqlalchemy import delete, update
+from sqlalchemy.orm import joinedload, selectinload
 
 from app.api import api_bp
 from app.extensions import db
@@ -18,13 +22,24 @@ from app.models import (
     User,
     utcnow,
 )
-from app.services.bookmark_import import parse_bookmark_html
 from app.services.common import normalize_url, parse_tags
-from app.services.content import check_link, fetch_and_extract
-from app.services.dead_link_jobs import PROBLEMATIC_RESULTS
+from app.services.content import (
+    ExtractedContent,
+    check_link,
+    fetch_and_extract,
+)
+from app.services.dead_link_jobs import (
+    PROBLEMATIC_RESULT_VALUES,
+    check_bookmark_links,
+)
+from app.services.import_jobs import (
+    get_import_job_details,
+    spool_import_upload,
+    start_import_job,
+)
 from app.services.internal_links import bookmark_is_internal, set_internal_link_status
-from app.services.search import search_bookmarks
-from app.services.security import api_auth_required
+from app.services.search import search_user_bookmarks
+from app.services.security import api_auth_required, bootstrap_completed
 from app.services.sync_enrichment_jobs import (
     start_sync_first_replace_server_enrichment,
 )
@@ -39,6 +54,7 @@ from app.services.sync import (
     create_confirmation_token,
     ensure_sync_client,
     log_sync_event,
+    purge_bookmark_rows,
     serialize_bookmark_for_sync,
     serialize_folder_for_sync,
     verify_confirmation_token,
@@ -54,15 +70,22 @@ def _to_bool(value, default=False):
 
 
 def _normalize_notes_value(value: str | None) -> str | None:
-    text = (value or "").strip()
+    if not value:
+        return None
+    text = value.strip()
     if not text:
         return None
-    if text.lower() == "none":
+    if len(text) == 4 and text.lower() == "none":
         return None
     return text
 
 
-def _assign_tags(user_id: int, bookmark: Bookmark, tags_input):
+def _assign_tags(
+    user_id: int,
+    bookmark: Bookmark,
+    tags_input,
+    tag_index: dict[str, Tag] | None = None,
+):
     if isinstance(tags_input, list):
         names = parse_tags(
             ",".join(str(item) for item in tags_input if item is not None)
@@ -70,12 +93,22 @@ def _assign_tags(user_id: int, bookmark: Bookmark, tags_input):
     else:
         names = parse_tags(tags_input or "")
 
+    existing = tag_index if tag_index is not None else {}
+    if names and tag_index is None:
+        existing = {
+            tag.name: tag
+            for tag in Tag.query.filter(
+                Tag.user_id == user_id, Tag.name.in_(names)
+            ).all()
+        }
+
     bookmark.tags.clear()
     for name in names:
-        tag = Tag.query.filter_by(user_id=user_id, name=name).first()
+        tag = existing.get(name)
         if not tag:
             tag = Tag(user_id=user_id, name=name)
             db.session.add(tag)
+            existing[name] = tag
         bookmark.tags.append(tag)
 
 
@@ -96,10 +129,11 @@ def _refresh_content(
     content = bookmark.content or BookmarkContent(bookmark_id=bookmark.id)
     if populate_title and extracted.title and not bookmark.title:
         bookmark.title = extracted.title
+    now = utcnow()
     bookmark.link_status = extracted.status
-    bookmark.last_checked_at = utcnow()
+    bookmark.last_checked_at = now
     content.extracted_text = extracted.text
-    content.extracted_at = utcnow()
+    content.extracted_at = now
     content.fetch_status = extracted.status
     content.fetch_error = extracted.error
     if populate_notes:
@@ -112,8 +146,8 @@ def _refresh_content(
 
 
 def _get_user_bookmark_or_404(user_id: int, bookmark_id: int):
-    bookmark = Bookmark.query.filter_by(id=bookmark_id, user_id=user_id).first()
-    if not bookmark:
+    bookmark = db.session.get(Bookmark, bookmark_id)
+    if not bookmark or bookmark.user_id != user_id:
         return None, (jsonify({"error": "bookmark not found"}), 404)
     return bookmark, None
 
@@ -152,12 +186,11 @@ def _parse_local_folders(payload: dict) -> list[dict]:
     return parsed
 
 
-def _parse_local_bookmarks(payload: dict) -> list[dict]:
+def _iter_local_bookmark_urls(payload: dict):
     rows = payload.get("local_bookmarks") or []
     if not isinstance(rows, list):
-        return []
+        return
 
-    parsed: list[dict] = []
     for item in rows:
         if not isinstance(item, dict):
             continue
@@ -167,7 +200,12 @@ def _parse_local_bookmarks(payload: dict) -> list[dict]:
         normalized = normalize_url(url)
         if not normalized:
             continue
+        yield item, url, normalized
 
+
+def _parse_local_bookmarks(payload: dict) -> list[dict]:
+    parsed: list[dict] = []
+    for item, url, normalized in _iter_local_bookmark_urls(payload):
         tags_input = item.get("tags")
         tags: list[str]
         if isinstance(tags_input, list):
@@ -188,7 +226,7 @@ def _parse_local_bookmarks(payload: dict) -> list[dict]:
         clean_folder_path: list[str] = []
         if isinstance(folder_path, list):
             clean_folder_path = [
-                str(part).strip() for part in folder_path if str(part).strip()
+                part for part in (str(value).strip() for value in folder_path) if part
             ]
 
         parsed.append(
@@ -211,15 +249,43 @@ def _active_server_bookmarks(user_id: int) -> list[Bookmark]:
     return (
         Bookmark.query.filter_by(user_id=user_id)
         .filter(Bookmark.deleted_at.is_(None))
+        .options(selectinload(Bookmark.tags))
         .order_by(Bookmark.updated_at.desc())
         .all()
     )
 
 
+def _active_server_bookmark_keys(user_id: int):
+    return (
+        db.session.query(Bookmark.id, Bookmark.normalized_url)
+        .filter(Bookmark.user_id == user_id, Bookmark.deleted_at.is_(None))
+        .order_by(Bookmark.updated_at.desc())
+        .all()
+    )
+
+
+def _active_server_bookmark_count(user_id: int) -> int:
+    return (
+        db.session.query(db.func.count(Bookmark.id))
+        .filter(Bookmark.user_id == user_id, Bookmark.deleted_at.is_(None))
+        .scalar()
+    )
+
+
+def _active_server_normalized_urls(user_id: int) -> list[str]:
+    rows = (
+        db.session.query(Bookmark.normalized_url)
+        .filter(Bookmark.user_id == user_id, Bookmark.deleted_at.is_(None))
+        .all()
+    )
+    return [row.normalized_url for row in rows]
+
+
 def _sync_snapshot_server_bookmarks(user_id: int) -> list[Bookmark]:
     return (
         Bookmark.query.filter_by(user_id=user_id)
         .filter(Bookmark.deleted_at.is_(None))
+        .options(selectinload(Bookmark.tags))
         .order_by(Bookmark.created_at.asc(), Bookmark.id.asc())
         .all()
     )
@@ -230,36 +296,15 @@ def _active_server_folders(user_id: int) -> list[Folder]:
 
 
 def _estimate_two_way_merge_counts(
-    local_bookmarks: list[dict],
-    server_bookmarks: list[Bookmark],
+    local_normalized_urls: list[str],
+    server_normalized_urls: list[str],
 ) -> dict:
-    local_counts: dict[str, int] = {}
-    server_counts: dict[str, int] = {}
-
-    for item in local_bookmarks:
-        normalized = item["normalized_url"]
-        local_counts[normalized] = local_counts.get(normalized, 0) + 1
-    for bookmark in server_bookmarks:
-        normalized = bookmark.normalized_url or ""
-        if not normalized:
-            continue
-        server_counts[normalized] = server_counts.get(normalized, 0) + 1
-
-    local_only = 0
-    server_only = 0
-    matched = 0
-    for normalized in set(local_counts) | set(server_counts):
-        local_count = local_counts.get(normalized, 0)
-        server_count = server_counts.get(normalized, 0)
-        overlap = min(local_count, server_count)
-        matched += overlap
-        local_only += local_count - overlap
-        server_only += server_count - overlap
-
+    local_counts = Counter(local_normalized_urls)
+    server_counts = Counter(url for url in server_normalized_urls if url)
     return {
-        "local_add_to_server": local_only,
-        "server_add_to_local": server_only,
-        "matched": matched,
+        "local_add_to_server": sum((local_counts - server_counts).values()),
+        "server_add_to_local": sum((server_counts - local_counts).values()),
+        "matched": sum((local_counts & server_counts).values()),
     }
 
 
@@ -281,11 +326,15 @@ def _preflight_warning(mode: str) -> str:
 
 
 def _build_sync_preflight_payload(
-    mode: str, local_bookmarks: list[dict], user_id: int
+    mode: str, local_normalized_urls: list[str], user_id: int
 ) -> dict:
-    server_bookmarks = _active_server_bookmarks(user_id)
-    local_count = len(local_bookmarks)
-    server_count = len(server_bookmarks)
+    server_normalized_urls: list[str] = []
+    if mode == SYNC_MODE_TWO_WAY:
+        server_normalized_urls = _active_server_normalized_urls(user_id)
+        server_count = len(server_normalized_urls)
+    else:
+        server_count = _active_server_bookmark_count(user_id)
+    local_count = len(local_normalized_urls)
 
     would_noop = False
     no_op_reason = None
@@ -310,7 +359,9 @@ def _build_sync_preflight_payload(
             "server_additions": 0 if would_noop else local_count,
         }
     else:
-        merge_counts = _estimate_two_way_merge_counts(local_bookmarks, server_bookmarks)
+        merge_counts = _estimate_two_way_merge_counts(
+            local_normalized_urls, server_normalized_urls
+        )
         impact = {
             "local_deletions": 0,
             "local_additions": merge_counts["server_add_to_local"],
@@ -367,10 +418,19 @@ def _delete_server_folder_tree(user_id: int) -> int:
     for folder in folders:
         walk(folder)
 
-    for folder in ordered:
-        payload = serialize_folder_for_sync(folder)
-        log_sync_event(user_id, "folder", folder.id, "delete", payload)
-        db.session.delete(folder)
+    db.session.add_all(
+        [
+            SyncEvent(
+                user_id=user_id,
+                entity_type="folder",
+                entity_id=folder.id,
+                action="delete",
+                payload=serialize_folder_for_sync(folder),
+            )
+            for folder in ordered
+        ]
+    )
+    db.session.execute(delete(Folder).where(Folder.user_id == user_id))
 
     return len(ordered)
 
@@ -381,7 +441,25 @@ def _ensure_server_folders_from_local(
     local_bookmarks: list[dict],
 ) -> dict[str, int]:
     mapping: dict[str, int] = {}
-    cache: dict[tuple[int | None, str], int] = {}
+    folder_index: dict[tuple[int | None, str], Folder] = {}
+    for folder in Folder.query.filter_by(user_id=user_id).order_by(Folder.id.asc()):
+        folder_index.setdefault((folder.parent_id, folder.name), folder)
+
+    def ensure_folder(name: str, parent_id: int | None) -> int:
+        folder = folder_index.get((parent_id, name))
+        if not folder:
+            folder = Folder(user_id=user_id, name=name, parent_id=parent_id)
+            db.session.add(folder)
+            db.session.flush()
+            log_sync_event(
+                user_id,
+                "folder",
+                folder.id,
+                "create",
+                serialize_folder_for_sync(folder),
+            )
+            folder_index[(parent_id, name)] = folder
+        return folder.id
 
     def ensure_path(path_parts: list[str]) -> int | None:
         parent_id = None
@@ -389,84 +467,29 @@ def _ensure_server_folders_from_local(
             name = (part or "").strip()
             if not name:
                 continue
-            key = (parent_id, name)
-            if key in cache:
-                parent_id = cache[key]
-                continue
-
-            folder = Folder.query.filter_by(
-                user_id=user_id,
-                name=name,
-                parent_id=parent_id,
-            ).first()
-            if not folder:
-                folder = Folder(user_id=user_id, name=name, parent_id=parent_id)
-                db.session.add(folder)
-                db.session.flush()
-                log_sync_event(
-                    user_id,
-                    "folder",
-                    folder.id,
-                    "create",
-                    serialize_folder_for_sync(folder),
-                )
-            parent_id = folder.id
-            cache[key] = parent_id
+            parent_id = ensure_folder(name, parent_id)
         return parent_id
 
-    pending = {row["id"]: row for row in local_folders}
-    while pending:
-        progressed = False
-        for local_id, row in list(pending.items()):
-            parent_local_id = row.get("parent_id")
-            if parent_local_id and parent_local_id not in mapping:
-                continue
-            parent_server_id = mapping.get(parent_local_id)
-            folder = Folder.query.filter_by(
-                user_id=user_id,
-                name=row["title"],
-                parent_id=parent_server_id,
-            ).first()
-            if not folder:
-                folder = Folder(
-                    user_id=user_id,
-                    name=row["title"],
-                    parent_id=parent_server_id,
-                )
-                db.session.add(folder)
-                db.session.flush()
-                log_sync_event(
-                    user_id,
-                    "folder",
-                    folder.id,
-                    "create",
-                    serialize_folder_for_sync(folder),
-                )
-            mapping[local_id] = folder.id
-            cache[(parent_server_id, row["title"])] = folder.id
-            pending.pop(local_id)
-            progressed = True
-        if not progressed:
-            for local_id, row in list(pending.items()):
-                folder = Folder.query.filter_by(
-                    user_id=user_id,
-                    name=row["title"],
-                    parent_id=None,
-                ).first()
-                if not folder:
-                    folder = Folder(user_id=user_id, name=row["title"], parent_id=None)
-                    db.session.add(folder)
-                    db.session.flush()
-                    log_sync_event(
-                        user_id,
-                        "folder",
-                        folder.id,
-                        "create",
-                        serialize_folder_for_sync(folder),
-                    )
-                mapping[local_id] = folder.id
-                cache[(None, row["title"])] = folder.id
-                pending.pop(local_id)
+    local_ids = {row["id"] for row in local_folders}
+    children_by_parent: dict[str, list[dict]] = {}
+    queue: deque[dict] = deque()
+    for row in local_folders:
+        parent_local_id = row.get("parent_id")
+        if parent_local_id and parent_local_id in local_ids:
+            children_by_parent.setdefault(parent_local_id, []).append(row)
+        else:
+            queue.append(row)
+
+    while queue:
+        row = queue.popleft()
+        parent_server_id = mapping.get(row.get("parent_id"))
+        mapping[row["id"]] = ensure_folder(row["title"], parent_server_id)
+        queue.extend(children_by_parent.get(row["id"], []))
+
+    # Folders caught in a parent cycle are never reached from a root.
+    for row in local_folders:
+        if row["id"] not in mapping:
+            mapping[row["id"]] = ensure_folder(row["title"], None)
 
     for bookmark in local_bookmarks:
         local_folder_id = bookmark.get("folder_local_id")
@@ -480,11 +503,16 @@ def _ensure_server_folders_from_local(
     return mapping
 
 
-def _create_server_bookmark_from_local(
+def _user_tag_index(user_id: int) -> dict[str, Tag]:
+    return {tag.name: tag for tag in Tag.query.filter_by(user_id=user_id).all()}
+
+
+def _create_server_bookmark_row(
     user: User,
     item: dict,
     folder_map: dict[str, int],
-    populate_content: bool = True,
+    tag_index: dict[str, Tag] | None = None,
+    now: datetime | None = None,
 ) -> Bookmark | None:
     url = (item.get("url") or "").strip()
     normalized = normalize_url(url)
@@ -501,31 +529,67 @@ def _create_server_bookmark_from_local(
         title=item.get("title"),
         notes=item.get("notes"),
     )
+    if now is not None:
+        bookmark.created_at = now
+        bookmark.updated_at = now
     db.session.add(bookmark)
     db.session.flush()
-    _assign_tags(user.id, bookmark, item.get("tags") or [])
-    if populate_content:
-        extracted = fetch_and_extract(
-            bookmark.url,
-            timeout=current_app.config["CONTENT_FETCH_TIMEOUT"],
-            max_bytes=current_app.config["CONTENT_MAX_BYTES"],
+    _assign_tags(user.id, bookmark, item.get("tags") or [], tag_index=tag_index)
+    return bookmark
+
+
+def _apply_extracted_content(
+    bookmark: Bookmark,
+    extracted: ExtractedContent,
+    now: datetime | None = None,
+) -> None:
+    now = now or utcnow()
+    content = bookmark.content or BookmarkContent(bookmark_id=bookmark.id)
+    bookmark.link_status = extracted.status
+    bookmark.last_checked_at = now
+    content.extracted_text = extracted.text
+    content.extracted_at = now
+    content.fetch_status = extracted.status
+    content.fetch_error = extracted.error
+    content.content_hash = extracted.content_hash
+    extracted_notes = _normalize_notes_value(extracted.text)
+    if extracted_notes:
+        bookmark.notes = extracted_notes
+    elif _normalize_notes_value(bookmark.notes) is None:
+        bookmark.notes = None
+    db.session.add(content)
+
+
+def _fetch_extracted_contents(urls: list[str]) -> list[ExtractedContent]:
+    if not urls:
+        return []
+    timeout = current_app.config["CONTENT_FETCH_TIMEOUT"]
+    max_bytes = current_app.config["CONTENT_MAX_BYTES"]
+    max_workers = int(current_app.config.get("SYNC_ENRICHMENT_WORKERS", 8))
+    max_workers = max(1, min(max_workers, 32, len(urls)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(
+                lambda url: fetch_and_extract(
+                    url, timeout=timeout, max_bytes=max_bytes
+                ),
+                urls,
+            )
         )
-        content = bookmark.content or BookmarkContent(bookmark_id=bookmark.id)
-        bookmark.link_status = extracted.status
-        bookmark.last_checked_at = utcnow()
-        content.extracted_text = extracted.text
-        content.extracted_at = utcnow()
-        content.fetch_status = extracted.status
-        content.fetch_error = extracted.error
-        content.content_hash = hashlib.sha256(
-            extracted.text.encode("utf-8")
-        ).hexdigest()
-        extracted_notes = _normalize_notes_value(extracted.text)
-        if extracted_notes:
-            bookmark.notes = extracted_notes
-        elif _normalize_notes_value(bookmark.notes) is None:
-            bookmark.notes = None
-        db.session.add(content)
+
+
+def _create_server_bookmark_from_local(
+    user: User,
+    item: dict,
+    folder_map: dict[str, int],
+    tag_index: dict[str, Tag] | None = None,
+    now: datetime | None = None,
+) -> Bookmark | None:
+    bookmark = _create_server_bookmark_row(
+        user, item, folder_map, tag_index=tag_index, now=now
+    )
+    if not bookmark:
+        return None
     log_sync_event(
         user.id,
         "bookmark",
@@ -542,9 +606,13 @@ def _replace_server_with_local_snapshot(
     local_bookmarks: list[dict],
 ) -> tuple[dict[str, int], dict[str, int], dict, list[int]]:
     active_server_bookmarks = _active_server_bookmarks(user.id)
+    now = utcnow()
+    db.session.execute(
+        update(Bookmark)
+        .where(Bookmark.user_id == user.id, Bookmark.deleted_at.is_(None))
+        .values(deleted_at=now, deleted_by=user.id, updated_at=now)
+    )
     for bookmark in active_server_bookmarks:
-        bookmark.deleted_at = utcnow()
-        bookmark.deleted_by = user.id
         log_sync_event(
             user.id,
             "bookmark",
@@ -553,15 +621,18 @@ def _replace_server_with_local_snapshot(
             serialize_bookmark_for_sync(bookmark),
         )
 
-    all_bookmarks = Bookmark.query.filter_by(user_id=user.id).all()
-    for bookmark in all_bookmarks:
-        bookmark.folder_id = None
+    db.session.execute(
+        update(Bookmark)
+        .where(Bookmark.user_id == user.id, Bookmark.folder_id.is_not(None))
+        .values(folder_id=None)
+    )
 
     deleted_folders = _delete_server_folder_tree(user.id)
     folder_map = _ensure_server_folders_from_local(
         user.id, local_folders, local_bookmarks
     )
 
+    tag_index = _user_tag_index(user.id)
     bookmark_map: dict[str, int] = {}
     created_bookmark_ids: list[int] = []
     created_count = 0
@@ -570,7 +641,8 @@ def _replace_server_with_local_snapshot(
             user,
             item,
             folder_map,
-            populate_content=False,
+            tag_index=tag_index,
+            now=now,
         )
         if not created:
             continue
@@ -596,41 +668,50 @@ def _two_way_merge_snapshot(
     folder_map = _ensure_server_folders_from_local(
         user.id, local_folders, local_bookmarks
     )
-    server_bookmarks = _active_server_bookmarks(user.id)
-    by_normalized: dict[str, list[Bookmark]] = {}
-    for bookmark in server_bookmarks:
-        by_normalized.setdefault(bookmark.normalized_url, []).append(bookmark)
+    by_normalized: defaultdict[str, deque[int]] = defaultdict(deque)
+    for bookmark_id, normalized_url in _active_server_bookmark_keys(user.id):
+        by_normalized[normalized_url].append(bookmark_id)
 
-    used_server_ids: set[int] = set()
+    tag_index = _user_tag_index(user.id)
     bookmark_map: dict[str, int] = {}
-    created_count = 0
+    created_rows: list[Bookmark] = []
     updated_count = 0
+    now = utcnow()
 
     for item in local_bookmarks:
-        normalized = item["normalized_url"]
-        matches = by_normalized.get(normalized, [])
-        matched: Bookmark | None = None
-        for candidate in matches:
-            if candidate.id in used_server_ids:
-                continue
-            matched = candidate
-            break
-
-        if matched:
-            used_server_ids.add(matched.id)
+        matches = by_normalized.get(item["normalized_url"])
+        if matches:
+            matched_id = matches.popleft()
             local_id = item.get("id")
             if local_id:
-                bookmark_map[local_id] = matched.id
+                bookmark_map[local_id] = matched_id
             continue
 
-        created = _create_server_bookmark_from_local(user, item, folder_map)
+        created = _create_server_bookmark_row(
+            user, item, folder_map, tag_index=tag_index, now=now
+        )
         if not created:
             continue
-        created_count += 1
+        created_rows.append(created)
         local_id = item.get("id")
         if local_id:
             bookmark_map[local_id] = created.id
 
+    # Fetch page content for the new rows concurrently; the session is only
+    # touched again once all results are back.
+    extracted_rows = _fetch_extracted_contents([row.url for row in created_rows])
+    checked_at = utcnow()
+    for bookmark, extracted in zip(created_rows, extracted_rows, strict=True):
+        _apply_extracted_content(bookmark, extracted, now=checked_at)
+        log_sync_event(
+            user.id,
+            "bookmark",
+            bookmark.id,
+            "create",
+            serialize_bookmark_for_sync(bookmark),
+        )
+    created_count = len(created_rows)
+
     counts = {
         "server_created": created_count,
         "server_updated": updated_count,
@@ -645,7 +726,7 @@ def health():
 
 @api_bp.route("/auth/bootstrap-admin", methods=["POST"])
 def bootstrap_admin_api():
-    if User.query.count() > 0:
+    if bootstrap_completed():
         return jsonify({"error": "bootstrap already completed"}), 409
 
     payload = request.get_json(silent=True) or {}
@@ -755,8 +836,8 @@ def folders_create():
 @api_auth_required()
 def folders_update(folder_id: int):
     user = g.api_user
-    folder = Folder.query.filter_by(id=folder_id, user_id=user.id).first()
-    if not folder:
+    folder = db.session.get(Folder, folder_id)
+    if not folder or folder.user_id != user.id:
         return jsonify({"error": "folder not found"}), 404
 
     payload = request.get_json(silent=True) or {}
@@ -779,12 +860,29 @@ def folders_update(folder_id: int):
 @api_auth_required()
 def folders_delete(folder_id: int):
     user = g.api_user
-    folder = Folder.query.filter_by(id=folder_id, user_id=user.id).first()
-    if not folder:
+    folder = db.session.get(Folder, folder_id)
+    if not folder or folder.user_id != user.id:
         return jsonify({"error": "folder not found"}), 404
 
-    for bookmark in folder.bookmarks:
-        bookmark.folder_id = None
+    bookmarks = (
+        Bookmark.query.filter_by(user_id=user.id, folder_id=folder.id)
+        .options(selectinload(Bookmark.tags))
+        .all()
+    )
+    children = Folder.query.filter_by(user_id=user.id, parent_id=folder.id).all()
+    now = utcnow()
+    db.session.execute(
+        update(Bookmark)
+        .where(Bookmark.user_id == user.id, Bookmark.folder_id == folder.id)
+        .values(folder_id=None, updated_at=now)
+    )
+    db.session.execute(
+        update(Folder)
+        .where(Folder.user_id == user.id, Folder.parent_id == folder.id)
+        .values(parent_id=None, updated_at=now)
+    )
+
+    for bookmark in bookmarks:
         log_sync_event(
             user.id,
             "bookmark",
@@ -792,8 +890,7 @@ def folders_delete(folder_id: int):
             "update",
             serialize_bookmark_for_sync(bookmark),
         )
-    for child in folder.children:
-        child.parent_id = None
+    for child in children:
         log_sync_event(
             user.id,
             "folder",
@@ -829,7 +926,11 @@ def bookmarks_list_api():
         query = query.filter(Bookmark.deleted_at.is_(None))
     if folder_id:
         query = query.filter_by(folder_id=folder_id)
-    items = query.order_by(Bookmark.updated_at.desc()).all()
+    items = (
+        query.options(selectinload(Bookmark.tags), joinedload(Bookmark.folder))
+        .order_by(Bookmark.updated_at.desc())
+        .all()
+    )
     return jsonify({"items": [item.as_dict() for item in items]})
 
 
@@ -943,6 +1044,7 @@ def recycle_list_api():
     items = (
         Bookmark.query.filter_by(user_id=user.id)
         .filter(Bookmark.deleted_at.is_not(None))
+        .options(selectinload(Bookmark.tags), joinedload(Bookmark.folder))
         .order_by(Bookmark.deleted_at.desc())
         .all()
     )
@@ -976,11 +1078,8 @@ def recycle_purge_api(bookmark_id: int):
     bookmark, error = _get_user_bookmark_or_404(user.id, bookmark_id)
     if error:
         return error
-    if bookmark.content:
-        db.session.delete(bookmark.content)
-    bookmark.tags.clear()
     log_sync_event(user.id, "bookmark", bookmark.id, "purge", {"id": bookmark.id})
-    db.session.delete(bookmark)
+    purge_bookmark_rows([bookmark.id])
     db.session.commit()
     return jsonify({"status": "purged"})
 
@@ -993,99 +1092,17 @@ def import_browser_html_api():
     if not upload:
         return jsonify({"error": "file field is required"}), 400
 
-    html = upload.read().decode("utf-8", errors="ignore")
-    entries = parse_bookmark_html(html)
-    job = ImportJob(user_id=user.id, status="running", progress=0)
+    path = spool_import_upload(upload)
+    job = ImportJob(user_id=user.id, status="pending", progress=0)
     db.session.add(job)
     db.session.commit()
-
-    created = 0
-    skipped = 0
-    total = len(entries)
-
-    folder_cache = {}
-
-    def ensure_folder(path_parts: list[str]):
-        parent_id = None
-        for part in path_parts:
-            key = (parent_id, part)
-            if key in folder_cache:
-                parent_id = folder_cache[key]
-                continue
-            folder = Folder.query.filter_by(
-                user_id=user.id, name=part, parent_id=parent_id
-            ).first()
-            if not folder:
-                folder = Folder(user_id=user.id, name=part, parent_id=parent_id)
-                db.session.add(folder)
-                db.session.flush()
-                log_sync_event(
-                    user.id,
-                    "folder",
-                    folder.id,
-                    "create",
-                    serialize_folder_for_sync(folder),
-                )
-            parent_id = folder.id
-            folder_cache[key] = parent_id
-        return parent_id
-
-    try:
-        for idx, entry in enumerate(entries, start=1):
-            folder_id = ensure_folder(entry.folder_path)
-            normalized = normalize_url(entry.url)
-            existing = Bookmark.query.filter_by(
-                user_id=user.id, normalized_url=normalized
-            ).first()
-            if existing and existing.deleted_at is None:
-                skipped += 1
-            elif existing:
-                existing.deleted_at = None
-                existing.deleted_by = None
-                existing.title = existing.title or entry.title
-                existing.folder_id = existing.folder_id or folder_id
-                _refresh_content(existing, populate_notes=True, populate_title=False)
-                log_sync_event(
-                    user.id,
-                    "bookmark",
-                    existing.id,
-                    "restore",
-                    serialize_bookmark_for_sync(existing),
-                )
-                created += 1
-            else:
-                bookmark = Bookmark(
-                    user_id=user.id,
-                    folder_id=folder_id,
-                    url=entry.url,
-                    normalized_url=normalized,
-                    title=entry.title or None,
-                )
-                db.session.add(bookmark)
-                db.session.flush()
-                _refresh_content(bookmark, populate_notes=True, populate_title=False)
-                log_sync_event(
-                    user.id,
-                    "bookmark",
-                    bookmark.id,
-                    "create",
-                    serialize_bookmark_for_sync(bookmark),
-                )
-                created += 1
-
-            job.progress = int((idx / total) * 100) if total else 100
-
-        job.status = "done"
-        job.total_created = created
-        job.total_skipped = skipped
-        db.session.commit()
-    except Exception as exc:
-        job.status = "failed"
-        job.error_message = str(exc)
-        db.session.commit()
-        return jsonify({"error": "import failed", "job": job.as_dict()}), 500
-
-    return jsonify({"status": "done", "job": job.as_dict()})
+    start_import_job(
+        app=current_app._get_current_object(),
+        user_id=user.id,
+        job_id=job.id,
+        path=path,
+    )
+    return jsonify({"status": "pending", "job": job.as_dict()}), 202
 
 
 @api_bp.route("/import/jobs/<int:job_id>", methods=["GET"])
@@ -1095,7 +1112,7 @@ def import_job_status(job_id: int):
     job = ImportJob.query.filter_by(id=job_id, user_id=user.id).first()
     if not job:
         return jsonify({"error": "job not found"}), 404
-    return jsonify(job.as_dict())
+    return jsonify(get_import_job_details(job))
 
 
 @api_bp.route("/search", methods=["GET"])
@@ -1106,14 +1123,8 @@ def search_api():
     if not query:
         return jsonify({"items": []})
 
-    source = (
-        Bookmark.query.filter_by(user_id=user.id)
-        .filter(Bookmark.deleted_at.is_(None))
-        .order_by(Bookmark.updated_at.desc())
-        .all()
-    )
-    ranked = search_bookmarks(
-        source, query, limit=request.args.get("limit", type=int) or 50
+    ranked = search_user_bookmarks(
+        user.id, query, limit=request.args.get("limit", type=int) or 50
     )
     return jsonify(
         {
@@ -1180,30 +1191,13 @@ def check_bulk_bookmarks():
     targets_query = (
         Bookmark.query.filter_by(user_id=user.id)
         .filter(Bookmark.deleted_at.is_(None))
+        .options(selectinload(Bookmark.tags))
         .order_by(Bookmark.last_checked_at.is_not(None), Bookmark.last_checked_at.asc())
     )
     if limit:
         targets_query = targets_query.limit(int(limit))
     targets = targets_query.all()
-    for bookmark in targets:
-        if bookmark_is_internal(bookmark):
-            set_internal_link_status(bookmark)
-            continue
-
-        result = check_link(
-            bookmark.url, timeout=current_app.config["CONTENT_FETCH_TIMEOUT"]
-        )
-        bookmark.link_status = result.result_type
-        bookmark.last_checked_at = utcnow()
-        check = LinkCheck(
-            bookmark_id=bookmark.id,
-            status_code=result.status_code,
-            final_url=result.final_url,
-            result_type=result.result_type,
-            latency_ms=result.latency_ms,
-            error=result.error,
-        )
-        db.session.add(check)
+    check_bookmark_links(current_app._get_current_object(), targets)
     db.session.commit()
     return jsonify({"status": "done", "checked": len(targets)})
 
@@ -1215,7 +1209,8 @@ def dead_links_api():
     items = (
         Bookmark.query.filter_by(user_id=user.id)
         .filter(Bookmark.deleted_at.is_(None))
-        .filter(Bookmark.link_status.in_(list(PROBLEMATIC_RESULTS)))
+        .filter(Bookmark.link_status.in_(PROBLEMATIC_RESULT_VALUES))
+        .options(selectinload(Bookmark.tags), joinedload(Bookmark.folder))
         .order_by(Bookmark.last_checked_at.desc())
         .all()
     )
@@ -1251,7 +1246,7 @@ def sync_first_preflight():
     payload = request.get_json(silent=True) or {}
     client_id = (payload.get("client_id") or "").strip()
     mode = _normalize_sync_mode(payload.get("mode"))
-    local_bookmarks = _parse_local_bookmarks(payload)
+    local_urls = list(_iter_local_bookmark_urls(payload))
 
     if not client_id:
         return jsonify({"error": "client_id is required"}), 400
@@ -1262,10 +1257,11 @@ def sync_first_preflight():
 
     preflight = _build_sync_preflight_payload(
         mode=mode,
-        local_bookmarks=local_bookmarks,
+        local_normalized_urls=[normalized for _, _, normalized in local_urls],
         user_id=user.id,
     )
 
+    ttl_seconds = current_app.config["SYNC_CONFIRM_TTL_SECONDS"]
     token = create_confirmation_token(
         secret_key=current_app.config["SECRET_KEY"],
         user_id=user.id,
@@ -1273,15 +1269,15 @@ def sync_first_preflight():
         mode=mode,
         local_count=preflight["local_bookmark_count"],
         server_count=preflight["server_bookmark_count"],
-        ttl_seconds=current_app.config["SYNC_CONFIRM_TTL_SECONDS"],
+        ttl_seconds=ttl_seconds,
     )
 
     sample_removed = []
-    for item in local_bookmarks[:10]:
+    for item, url, _ in local_urls[:10]:
         sample_removed.append(
             {
-                "title": item.get("title") or "(untitled)",
-                "url": item.get("url") or "",
+                "title": (item.get("title") or "").strip() or "(untitled)",
+                "url": url,
             }
         )
 
@@ -1291,7 +1287,7 @@ def sync_first_preflight():
             "estimated_local_deletions": preflight["impact"]["local_deletions"],
             "sample_local_removals": sample_removed,
             "confirmation_token": token,
-            "confirmation_ttl_seconds": current_app.config["SYNC_CONFIRM_TTL_SECONDS"],
+            "confirmation_ttl_seconds": ttl_seconds,
         }
     )
 
@@ -1345,7 +1341,7 @@ def sync_first_apply():
     counts: dict = {}
     background_enrichment_ids: list[int] = []
 
-    server_count_now = len(_active_server_bookmarks(user.id))
+    server_count_now = _active_server_bookmark_count(user.id)
     local_count_now = len(local_bookmarks)
 
     if mode == SYNC_MODE_REPLACE_LOCAL and server_count_now == 0:
@@ -1455,7 +1451,7 @@ def sync_push():
     for operation in operations:
         results.append(apply_push_operation(user, operation))
 
-    db.session.commit()
+    db.session.flush()
     latest_cursor = (
         db.session.query(db.func.max(SyncEvent.id)).filter_by(user_id=user.id).scalar()
         or 0
@@ -1472,8 +1468,15 @@ def sync_pull():
     since = request.args.get("since", default=0, type=int)
     limit = request.args.get("limit", default=200, type=int)
     events = (
-        SyncEvent.query.filter_by(user_id=user.id)
-        .filter(SyncEvent.id > since)
+        db.session.query(
+            SyncEvent.id,
+            SyncEvent.entity_type,
+            SyncEvent.entity_id,
+            SyncEvent.action,
+            SyncEvent.payload,
+            SyncEvent.created_at,
+        )
+        .filter(SyncEvent.user_id == user.id, SyncEvent.id > since)
         .order_by(SyncEvent.id.asc())
         .limit(limit)
         .all()
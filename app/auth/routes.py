@@ -4,11 +4,12 @@ from flask_login import current_user, login_required, login_user, logout_user
 from app.auth import auth_bp
 from app.extensions import db
 from app.models import User
+from app.services.security import bootstrap_completed
 
 
 @auth_bp.route("/bootstrap", methods=["GET", "POST"])
 def bootstrap_admin():
-    if User.query.count() > 0:
+    if bootstrap_completed():
         return redirect(url_for("auth.login"))
 
     if request.method == "POST":
@@ -36,7 +37,7 @@ def login():
     if current_user.is_authenticated:
         return redirect(url_for("web.dashboard"))
 
-    if User.query.count() == 0:
+    if not bootstrap_completed():
         return redirect(url_for("auth.bootstrap_admin"))
 
     if request.method == "POST":
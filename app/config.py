@@ -1,5 +1,8 @@
 import os
+import tempfile
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -11,12 +14,31 @@ class Config:
         "DATABASE_URL", f"sqlite:///{BASE_DIR / 'linkloom.db'}"
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", "20"))
+    DB_POOL_TIMEOUT = int(os.environ.get("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", "3600"))
     SCHEDULER_ENABLED = os.environ.get("SCHEDULER_ENABLED", "1") == "1"
+    SCHEDULER_LOCK_FILE = os.environ.get(
+        "SCHEDULER_LOCK_FILE",
+        str(Path(tempfile.gettempdir()) / "linkloom-scheduler.lock"),
+    )
+    AUTO_MIGRATE = os.environ.get("AUTO_MIGRATE", "1") == "1"
+    TEMPLATE_CACHE_DIR = os.environ.get("TEMPLATE_CACHE_DIR") or None
     CONTENT_FETCH_TIMEOUT = float(os.environ.get("CONTENT_FETCH_TIMEOUT", "10"))
     CONTENT_MAX_BYTES = int(os.environ.get("CONTENT_MAX_BYTES", "2500000"))
     IMPORT_WORKERS = int(os.environ.get("IMPORT_WORKERS", "16"))
-    DEAD_LINK_WORKERS = int(os.environ.get("DEAD_LINK_WORKERS", "16"))
+    # Link checks wait on the network, so the default scales with the host
+    # well past its core count.
+    DEAD_LINK_WORKERS = int(
+        os.environ.get("DEAD_LINK_WORKERS") or min(64, (os.cpu_count() or 4) * 8)
+    )
+    DEAD_LINK_PER_HOST_LIMIT = int(os.environ.get("DEAD_LINK_PER_HOST_LIMIT", "4"))
     SYNC_ENRICHMENT_WORKERS = int(os.environ.get("SYNC_ENRICHMENT_WORKERS", "8"))
+    HTTP_MAX_CONNECTIONS = int(os.environ.get("HTTP_MAX_CONNECTIONS", "100"))
+    HTTP_MAX_KEEPALIVE_CONNECTIONS = int(
+        os.environ.get("HTTP_MAX_KEEPALIVE_CONNECTIONS", "64")
+    )
     DEAD_LINK_CHECK_INTERVAL_MINUTES = int(
         os.environ.get("DEAD_LINK_CHECK_INTERVAL_MINUTES", "1440")
     )
@@ -27,3 +49,15 @@ class TestConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
     SCHEDULER_ENABLED = False
+    AUTO_MIGRATE = False
+
+
+@lru_cache(maxsize=None)
+def config_values(config_object) -> MappingProxyType:
+    return MappingProxyType(
+        {
+            key: getattr(config_object, key)
+            for key in dir(config_object)
+            if key.isupper()
+        }
+    )
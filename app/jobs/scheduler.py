@@ -1,15 +1,26 @@
 import os
 from datetime import timedelta
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
 from apscheduler.schedulers.background import BackgroundScheduler
+from sqlalchemy.orm import selectinload
 
 from app.extensions import db
-from app.models import Bookmark, LinkCheck, utcnow
-from app.services.content import check_link
-from app.services.internal_links import bookmark_is_internal, set_internal_link_status
+from app.models import Bookmark, utcnow
+from app.services.dead_link_jobs import check_bookmark_links
 
 
-scheduler = BackgroundScheduler()
+# The sweep is the only job; one executor thread is enough and avoids the
+# default ten-thread pool sitting idle next to the request handlers.
+scheduler = BackgroundScheduler(
+    executors={"default": {"type": "threadpool", "max_workers": 1}},
+    job_defaults={"coalesce": True, "max_instances": 1},
+)
+_scheduler_lock_handle = None
 
 
 def run_dead_link_sweep(app):
@@ -21,6 +32,7 @@ def run_dead_link_sweep(app):
                 (Bookmark.last_checked_at.is_(None))
                 | (Bookmark.last_checked_at < stale_before)
             )
+            .options(selectinload(Bookmark.tags))
             .order_by(
                 Bookmark.last_checked_at.is_not(None), Bookmark.last_checked_at.asc()
             )
@@ -28,27 +40,26 @@ def run_dead_link_sweep(app):
             .all()
         )
 
-        for bookmark in bookmarks:
-            if bookmark_is_internal(bookmark):
-                set_internal_link_status(bookmark)
-                continue
+        check_bookmark_links(app, bookmarks)
+        db.session.commit()
 
-            result = check_link(
-                bookmark.url, timeout=app.config["CONTENT_FETCH_TIMEOUT"]
-            )
-            check = LinkCheck(
-                bookmark_id=bookmark.id,
-                status_code=result.status_code,
-                final_url=result.final_url,
-                result_type=result.result_type,
-                latency_ms=result.latency_ms,
-                error=result.error,
-            )
-            bookmark.link_status = result.result_type
-            bookmark.last_checked_at = utcnow()
-            db.session.add(check)
 
-        db.session.commit()
+def _acquire_scheduler_lock(path: str) -> bool:
+    global _scheduler_lock_handle
+    if _scheduler_lock_handle is not None:
+        return True
+    if fcntl is None:
+        return True
+
+    handle = open(path, "a")
+    try:
+        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        handle.close()
+        return False
+    # Keep the handle open for the life of the process so the lock is held.
+    _scheduler_lock_handle = handle
+    return True
 
 
 def start_scheduler(app):
@@ -56,6 +67,9 @@ def start_scheduler(app):
         return
     if os.environ.get("WERKZEUG_RUN_MAIN") == "false":
         return
+    if not _acquire_scheduler_lock(app.config["SCHEDULER_LOCK_FILE"]):
+        app.logger.info("Scheduler already running in another process; skipping.")
+        return
 
     interval_minutes = app.config["DEAD_LINK_CHECK_INTERVAL_MINUTES"]
     if not scheduler.get_jobs():
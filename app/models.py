@@ -96,7 +96,7 @@ class Bookmark(db.Model):
     deleted_by = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=True)
 
     url = db.Column(db.Text, nullable=False)
-    normalized_url = db.Column(db.Text, nullable=False, index=True)
+    normalized_url = db.Column(db.Text, nullable=False)
     title = db.Column(db.String(512), nullable=True)
     notes = db.Column(db.Text, nullable=True)
     link_status = db.Column(db.String(64), nullable=True)
@@ -116,6 +116,19 @@ class Bookmark(db.Model):
     __table_args__ = (
         db.Index("ix_bookmark_user_deleted", "user_id", "deleted_at"),
         db.Index("ix_bookmark_user_updated", "user_id", "updated_at"),
+        # Active-bookmark listings filter on deleted_at IS NULL and sort by
+        # updated_at; this lets them walk the index instead of sorting.
+        db.Index(
+            "ix_bookmark_user_active_updated", "user_id", "deleted_at", "updated_at"
+        ),
+        # Dedup lookups scope normalized_url to a user and usually to active or
+        # recycled rows.
+        db.Index(
+            "ix_bookmark_user_normalized_url",
+            "user_id",
+            "normalized_url",
+            "deleted_at",
+        ),
     )
 
     def as_dict(self, include_content=False):
@@ -1,12 +1,38 @@
 from __future__ import annotations
 
-from sqlalchemy import inspect, text
+from sqlalchemy import insert, inspect, select, text
 
 from app.extensions import db
-from app.models import Bookmark, Tag
+from app.models import Tag, bookmark_tags
 from app.services.common import parse_tags
 
 
+def create_missing_indexes() -> list[str]:
+    # create_all() only emits CREATE INDEX for tables it creates, so indexes
+    # added to existing tables are created here.
+    engine = db.engine
+    inspector = inspect(engine)
+    created = []
+    for table in db.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(bind=engine)
+                created.append(index.name)
+    return created
+
+
+def _load_tag_ids() -> dict[tuple[int, str], int]:
+    return {
+        (user_id, name): tag_id
+        for tag_id, user_id, name in db.session.execute(
+            select(Tag.id, Tag.user_id, Tag.name)
+        )
+    }
+
+
 def migrate_keywords_into_tags_and_drop_column() -> bool:
     engine = db.engine
     if engine.dialect.name != "sqlite":
@@ -29,28 +55,48 @@ def migrate_keywords_into_tags_and_drop_column() -> bool:
               AND TRIM(keywords_text) != ''
             """
         )
-    ).mappings()
-
-    for row in rows:
-        bookmark = Bookmark.query.filter_by(
-            id=row["id"], user_id=row["user_id"]
-        ).first()
-        if not bookmark:
-            continue
+    ).all()
 
-        existing_tag_names = {tag.name for tag in bookmark.tags}
-        for tag_name in parse_tags(row["keywords_text"] or ""):
-            if tag_name in existing_tag_names:
-                continue
+    wanted_links = {
+        (row.id, row.user_id, tag_name)
+        for row in rows
+        for tag_name in parse_tags(row.keywords_text or "")
+    }
+    if wanted_links:
+        tag_ids = _load_tag_ids()
+        missing_tags = {
+            (user_id, tag_name) for _, user_id, tag_name in wanted_links
+        } - tag_ids.keys()
+        if missing_tags:
+            db.session.execute(
+                insert(Tag),
+                [
+                    {"user_id": user_id, "name": tag_name}
+                    for user_id, tag_name in sorted(missing_tags)
+                ],
+            )
+            tag_ids = _load_tag_ids()
 
-            tag = Tag.query.filter_by(user_id=row["user_id"], name=tag_name).first()
-            if not tag:
-                tag = Tag(user_id=row["user_id"], name=tag_name)
-                db.session.add(tag)
-            bookmark.tags.append(tag)
-            existing_tag_names.add(tag_name)
+        existing_links = set(
+            db.session.execute(
+                select(bookmark_tags.c.bookmark_id, bookmark_tags.c.tag_id)
+            ).all()
+        )
+        new_links = {
+            (bookmark_id, tag_ids[(user_id, tag_name)])
+            for bookmark_id, user_id, tag_name in wanted_links
+        } - existing_links
+        if new_links:
+            db.session.execute(
+                insert(bookmark_tags),
+                [
+                    {"bookmark_id": bookmark_id, "tag_id": tag_id}
+                    for bookmark_id, tag_id in sorted(new_links)
+                ],
+            )
 
-    db.session.commit()
+    # Tags, links and the column drop commit together, so a failed drop leaves
+    # keywords_text in place for the next init-db run to retry.
     db.session.execute(text("ALTER TABLE bookmarks DROP COLUMN keywords_text"))
     db.session.commit()
     return True
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import codecs
+import io
+from collections.abc import Iterator
 from dataclasses import dataclass
-from typing import cast
+from typing import BinaryIO
 
-from bs4 import BeautifulSoup, Tag
+from lxml import etree
+
+_FOLDER_HEADINGS = {"h1", "h2", "h3"}
+_PARSED_TAGS = ("dl", "dt", "a", *_FOLDER_HEADINGS)
+_READ_CHUNK_BYTES = 64 * 1024
 
 
 @dataclass
@@ -13,86 +20,70 @@ class ImportedBookmark:
     folder_path: list[str]
 
 
-def _iter_dt_entries(dl: Tag) -> list[Tag]:
-    entries: list[Tag] = []
-    for dt in dl.find_all("dt"):
-        if not isinstance(dt, Tag):
+def _element_text(element) -> str:
+    if not len(element):
+        return (element.text or "").strip()
+    return "".join(part.strip() for part in element.itertext())
+
+
+def _iter_parse_events(stream: BinaryIO) -> Iterator[tuple[str, etree._Element]]:
+    parser = etree.HTMLPullParser(
+        events=("start", "end"),
+        tag=_PARSED_TAGS,
+        remove_comments=True,
+        remove_pis=True,
+    )
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    while True:
+        chunk = stream.read(_READ_CHUNK_BYTES)
+        if not chunk:
+            break
+        parser.feed(decoder.decode(chunk))
+        yield from parser.read_events()
+    parser.feed(decoder.decode(b"", final=True))
+    try:
+        parser.close()
+    except etree.XMLSyntaxError:
+        pass
+    yield from parser.read_events()
+
+
+def iter_bookmark_html(stream: BinaryIO) -> Iterator[ImportedBookmark]:
+    # Each <DL> opens a folder level named by the <H3> heading in the <DT>
+    # just before it. Only the first top-level <DL> is read.
+    folder_stack: list[str | None] = []
+    pending_folder: str | None = None
+    for event, element in _iter_parse_events(stream):
+        tag = element.tag if isinstance(element.tag, str) else ""
+        if event == "start":
+            if tag == "dl":
+                folder_stack.append(pending_folder)
+                pending_folder = None
             continue
-        parent_dl = dt.find_parent("dl")
-        if parent_dl is dl:
-            entries.append(cast(Tag, dt))
-    return entries
-
-
-def _find_nested_dl(dt: Tag) -> Tag | None:
-    nested = dt.find("dl")
-    if isinstance(nested, Tag):
-        return nested
-
-    sibling = dt.next_sibling
-    while sibling is not None:
-        if isinstance(sibling, Tag):
-            name = (sibling.name or "").lower()
-            if name == "dl":
-                return sibling
-            if name == "dt":
-                return None
-        sibling = sibling.next_sibling
-    return None
-
-
-def _find_anchor_in_dt(dt: Tag) -> Tag | None:
-    for anchor in dt.find_all("a"):
-        if isinstance(anchor, Tag) and anchor.find_parent("dt") is dt:
-            return anchor
-    return None
-
 
-def _find_folder_in_dt(dt: Tag) -> Tag | None:
-    for folder in dt.find_all(["h3", "h2", "h1"]):
-        if isinstance(folder, Tag) and folder.find_parent("dt") is dt:
-            return folder
-    return None
-
-
-def _parse_dl(dl: Tag, folder_path: list[str], out: list[ImportedBookmark]) -> None:
-    for dt in _iter_dt_entries(dl):
-        anchor = _find_anchor_in_dt(dt)
-        if isinstance(anchor, Tag):
-            href_value = anchor.get("href")
-            href = href_value.strip() if isinstance(href_value, str) else ""
-        else:
-            href = ""
-
-        if href:
-            text = anchor.get_text(strip=True) if isinstance(anchor, Tag) else ""
-            out.append(
-                ImportedBookmark(
-                    title=text.strip(),
+        if tag in _FOLDER_HEADINGS:
+            parent = element.getparent()
+            if folder_stack and parent is not None and parent.tag == "dt":
+                pending_folder = _element_text(element)
+        elif tag == "a":
+            href = (element.get("href") or "").strip()
+            if href and folder_stack:
+                yield ImportedBookmark(
+                    title=_element_text(element),
                     url=href,
-                    folder_path=folder_path.copy(),
+                    folder_path=[name for name in folder_stack if name is not None],
                 )
-            )
-
-        nested_dl = _find_nested_dl(dt)
-        folder = _find_folder_in_dt(dt)
-        if folder is None and nested_dl is not None:
-            for heading in dt.find_all(["h3", "h2", "h1"]):
-                if isinstance(heading, Tag):
-                    folder = heading
-                    break
-
-        if folder and nested_dl:
-            name = folder.get_text(strip=True)
-            _parse_dl(nested_dl, folder_path + [name], out)
+        elif tag == "dl":
+            folder_stack.pop()
+            pending_folder = None
+            if not folder_stack:
+                return
+        elif tag == "dt":
+            # Drop finished entries so memory stays flat on large exports.
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
 
 
 def parse_bookmark_html(html: str) -> list[ImportedBookmark]:
-    soup = BeautifulSoup(html, "lxml")
-    root = soup.find("dl")
-    if not isinstance(root, Tag):
-        return []
-
-    bookmarks: list[ImportedBookmark] = []
-    _parse_dl(root, [], bookmarks)
-    return [bm for bm in bookmarks if bm.url]
+    return list(iter_bookmark_html(io.BytesIO(html.encode("utf-8"))))
@@ -1,6 +1,10 @@
+from functools import lru_cache
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 
+# Sized to hold a large browser import, which normalizes every href once for
+# dedup and again when the rows are created.
+@lru_cache(maxsize=1 << 16)
 def normalize_url(url: str) -> str:
     if not url:
         return ""
@@ -13,8 +17,13 @@ def normalize_url(url: str) -> str:
     return urlunparse((scheme, netloc, path, "", normalized_query, ""))
 
 
+@lru_cache(maxsize=8192)
+def _parse_tag_names(raw: str) -> tuple[str, ...]:
+    tokens = [t.strip().lower() for t in raw.replace(";", ",").split(",")]
+    return tuple(sorted({t for t in tokens if t}))
+
+
 def parse_tags(raw: str) -> list[str]:
     if not raw:
         return []
-    tokens = [t.strip().lower() for t in raw.replace(";", ",").split(",")]
-    return sorted({t for t in tokens if t})
+    return list(_parse_tag_names(raw))
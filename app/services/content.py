@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import hashlib
+import re
+import threading
 import time
 import warnings
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 
 import httpx
 from bs4 import BeautifulSoup, XMLParsedAsHTMLWarning
@@ -17,6 +21,15 @@ DEFAULT_HEADERS = {
     "User-Agent": "LinkLoomBot/1.0 (+https://linkloom.local)",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
 }
+_FETCH_CHUNK_BYTES = 64 * 1024
+_MAX_EXTRACTED_CHARS = 200000
+
+# Page fetches and link checks share one client so keep-alive connections and
+# TLS sessions are reused across bookmarks on the same host. httpx.Client is
+# thread-safe, so the worker pools can all use it; create_app sizes its pool.
+_http_limits = httpx.Limits(max_connections=100, max_keepalive_connections=64)
+_http_client: httpx.Client | None = None
+_http_client_lock = threading.Lock()
 
 _CERTIFICATE_ERROR_MARKERS = (
     "certificate verify failed",
@@ -24,6 +37,9 @@ _CERTIFICATE_ERROR_MARKERS = (
     "self signed certificate",
     "unable to get local issuer certificate",
 )
+_CERTIFICATE_ERROR_PATTERN = re.compile(
+    "|".join(re.escape(marker) for marker in _CERTIFICATE_ERROR_MARKERS)
+)
 
 LINK_STATUS_ALIVE = "alive"
 LINK_STATUS_TIMEOUT = "timeout"
@@ -32,12 +48,20 @@ LINK_STATUS_SERVER_ERROR = "server_error"
 LINK_STATUS_DNS_ERROR = "dns_error"
 LINK_STATUS_UNREACHABLE = "unreachable"
 
-TRANSIENT_LINK_RESULTS = {
-    LINK_STATUS_TIMEOUT,
-    LINK_STATUS_UNREACHABLE,
-    LINK_STATUS_SERVER_ERROR,
+_STATUS_CODE_RESULTS = {
+    404: LINK_STATUS_NOT_FOUND,
+    408: LINK_STATUS_TIMEOUT,
+    410: LINK_STATUS_NOT_FOUND,
 }
 
+TRANSIENT_LINK_RESULTS = frozenset(
+    {
+        LINK_STATUS_TIMEOUT,
+        LINK_STATUS_UNREACHABLE,
+        LINK_STATUS_SERVER_ERROR,
+    }
+)
+
 
 @dataclass
 class ExtractedContent:
@@ -47,6 +71,12 @@ class ExtractedContent:
     error: str | None = None
     status_code: int | None = None
     final_url: str | None = None
+    # Hashed on construction so fetch worker threads do the work instead of
+    # the thread writing results to the database.
+    content_hash: str | None = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.content_hash = hash_content(self.text)
 
 
 @dataclass
@@ -58,6 +88,12 @@ class LinkCheckResult:
     error: str | None = None
 
 
+def hash_content(text: str) -> str | None:
+    if not text:
+        return None
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
 def _normalize_error(exc: Exception) -> str:
     message = str(exc).strip()
     if message:
@@ -65,33 +101,55 @@ def _normalize_error(exc: Exception) -> str:
     return exc.__class__.__name__
 
 
-def _is_untrusted_certificate_error(error: str | None) -> bool:
-    if not error:
-        return False
-    lowered = error.lower()
-    return any(marker in lowered for marker in _CERTIFICATE_ERROR_MARKERS)
+def _get_http_client() -> httpx.Client:
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                # An empty allow-list refuses every cookie, so the shared client
+                # never carries one site's cookies into later fetches.
+                _http_client = httpx.Client(
+                    follow_redirects=True,
+                    headers=DEFAULT_HEADERS,
+                    limits=_http_limits,
+                    cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+                )
+    return _http_client
+
+
+def configure_http_client(
+    max_connections: int, max_keepalive_connections: int
+) -> None:
+    global _http_client, _http_limits
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+    )
+    with _http_client_lock:
+        if limits == _http_limits:
+            return
+        _http_limits = limits
+        previous, _http_client = _http_client, None
+    if previous is not None:
+        previous.close()
 
 
 def fetch_html(url: str, timeout: float, max_bytes: int) -> tuple[str, str, int]:
-    with httpx.Client(
-        follow_redirects=True, timeout=timeout, headers=DEFAULT_HEADERS
-    ) as client:
-        with client.stream("GET", url) as response:
-            status_code = response.status_code
-            chunks = []
-            total = 0
-            for chunk in response.iter_bytes():
-                total += len(chunk)
-                if total > max_bytes:
-                    break
-                chunks.append(chunk)
-            data = b"".join(chunks)
-            encoding = response.encoding or "utf-8"
-            return (
-                data.decode(encoding, errors="ignore"),
-                str(response.url),
-                status_code,
-            )
+    with _get_http_client().stream("GET", url, timeout=timeout) as response:
+        status_code = response.status_code
+        data = bytearray()
+        for chunk in response.iter_bytes(chunk_size=_FETCH_CHUNK_BYTES):
+            remaining = max_bytes - len(data)
+            if len(chunk) >= remaining:
+                data += chunk[:remaining]
+                break
+            data += chunk
+        encoding = response.encoding or "utf-8"
+        return (
+            data.decode(encoding, errors="ignore"),
+            str(response.url),
+            status_code,
+        )
 
 
 def extract_text_from_html(html: str) -> tuple[str | None, str]:
@@ -100,18 +158,22 @@ def extract_text_from_html(html: str) -> tuple[str | None, str]:
 
     if trafilatura:
         try:
-            extracted = trafilatura.extract(
+            # One call parses the page once for both the text and the title;
+            # extract() plus extract_metadata() parsed it twice.
+            document = trafilatura.bare_extraction(
                 html,
                 include_comments=False,
                 include_tables=False,
                 favor_precision=True,
                 no_fallback=False,
+                with_metadata=True,
+                as_dict=False,
             )
-            if extracted:
-                text = extracted
-            meta = trafilatura.extract_metadata(html)
-            if meta and getattr(meta, "title", None):
-                title = meta.title.strip()
+            if document is not None:
+                if document.text:
+                    text = document.text
+                if document.title:
+                    title = document.title.strip()
         except Exception:
             pass
 
@@ -119,9 +181,16 @@ def extract_text_from_html(html: str) -> tuple[str | None, str]:
         soup = _build_soup(html)
         if soup.title and soup.title.string:
             title = soup.title.string.strip()
-        text = "\n".join(part.strip() for part in soup.stripped_strings)
+        parts = []
+        length = 0
+        for part in soup.stripped_strings:
+            parts.append(part)
+            length += len(part) + 1
+            if length > _MAX_EXTRACTED_CHARS:
+                break
+        text = "\n".join(parts)
 
-    return title, text[:200000]
+    return title, text[:_MAX_EXTRACTED_CHARS]
 
 
 def _build_soup(html: str) -> BeautifulSoup:
@@ -194,7 +263,7 @@ def fetch_and_extract(url: str, timeout: float, max_bytes: int) -> ExtractedCont
 def classify_status(status_code: int | None, error: str | None) -> str:
     if error:
         lower = error.lower()
-        if _is_untrusted_certificate_error(lower):
+        if _CERTIFICATE_ERROR_PATTERN.search(lower):
             return LINK_STATUS_ALIVE
         if "timed out" in lower or "timeout" in lower:
             return LINK_STATUS_TIMEOUT
@@ -206,10 +275,9 @@ def classify_status(status_code: int | None, error: str | None) -> str:
 
     if status_code is None:
         return LINK_STATUS_UNREACHABLE
-    if status_code in {404, 410}:
-        return LINK_STATUS_NOT_FOUND
-    if status_code == 408:
-        return LINK_STATUS_TIMEOUT
+    result = _STATUS_CODE_RESULTS.get(status_code)
+    if result:
+        return result
     if status_code >= 500:
         return LINK_STATUS_SERVER_ERROR
     if 200 <= status_code < 500:
@@ -218,23 +286,23 @@ def classify_status(status_code: int | None, error: str | None) -> str:
 
 
 def _check_link_once(
-    client: httpx.Client, url: str
+    client: httpx.Client, url: str, timeout: float
 ) -> tuple[int | None, str | None, str | None]:
     status_code = None
     final_url = None
     error = None
     try:
-        response = client.head(url)
+        response = client.head(url, timeout=timeout)
         status_code = response.status_code
         final_url = str(response.url)
         if status_code >= 400 or status_code in {405, 429}:
-            response = client.get(url)
+            response = client.get(url, timeout=timeout)
             status_code = response.status_code
             final_url = str(response.url)
     except Exception as exc:
         head_error = _normalize_error(exc)
         try:
-            response = client.get(url)
+            response = client.get(url, timeout=timeout)
             status_code = response.status_code
             final_url = str(response.url)
             error = None
@@ -251,14 +319,10 @@ def check_link(url: str, timeout: float) -> LinkCheckResult:
     error = None
     result_type = LINK_STATUS_UNREACHABLE
 
+    client = _get_http_client()
     for attempt in range(1, attempts + 1):
         timeout_value = timeout * (1 + (attempt - 1) * 0.5)
-        with httpx.Client(
-            follow_redirects=True,
-            timeout=timeout_value,
-            headers=DEFAULT_HEADERS,
-        ) as client:
-            status_code, final_url, error = _check_link_once(client, url)
+        status_code, final_url, error = _check_link_once(client, url, timeout_value)
         result_type = classify_status(status_code, error)
         if result_type == LINK_STATUS_ALIVE:
             break
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
-import hashlib
 import threading
-from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+import time
+from collections import Counter, deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import datetime
+from urllib.parse import urlsplit
 
 from flask import Flask
-from sqlalchemy.orm import joinedload
+from sqlalchemy import func, insert, update
+from sqlalchemy.orm import defer, selectinload
 
 from app.extensions import db
 from app.models import Bookmark, BookmarkContent, DeadLinkJob, LinkCheck, utcnow
+from app.services.common import normalize_url
 from app.services.content import (
     ExtractedContent,
     LINK_STATUS_DNS_ERROR,
@@ -18,18 +23,33 @@ from app.services.content import (
     LINK_STATUS_SERVER_ERROR,
     LINK_STATUS_TIMEOUT,
     LINK_STATUS_UNREACHABLE,
+    check_link,
     fetch_and_extract,
 )
-from app.services.internal_links import bookmark_is_internal, set_internal_link_status
+from app.services.internal_links import (
+    INTERNAL_LINK_STATUS,
+    bookmark_is_internal,
+    internal_bookmark_clause,
+    set_internal_link_status,
+)
 
-PROBLEMATIC_RESULTS = {
-    LINK_STATUS_NOT_FOUND,
-    "404",
-    LINK_STATUS_DNS_ERROR,
-    LINK_STATUS_UNREACHABLE,
-    LINK_STATUS_SERVER_ERROR,
-    LINK_STATUS_TIMEOUT,
-}
+PROBLEMATIC_RESULTS = frozenset(
+    {
+        LINK_STATUS_NOT_FOUND,
+        "404",
+        LINK_STATUS_DNS_ERROR,
+        LINK_STATUS_UNREACHABLE,
+        LINK_STATUS_SERVER_ERROR,
+        LINK_STATUS_TIMEOUT,
+    }
+)
+# Sorted once so status filters bind the same parameter list on every query.
+PROBLEMATIC_RESULT_VALUES = tuple(sorted(PROBLEMATIC_RESULTS))
+
+# Check results and job progress are committed in batches; each batch is
+# written under one savepoint and retried row by row only if it fails.
+_COMMIT_INTERVAL = 50
+_COMMIT_SECONDS = 2.0
 
 _RUNTIME_LOCK = threading.Lock()
 _RUNTIME_STATE: dict[int, dict] = {}
@@ -38,9 +58,11 @@ _STOP_REQUESTED: set[int] = set()
 
 @dataclass
 class _LinkTarget:
-    bookmark_id: int
+    bookmark: Bookmark
     url: str
     title: str | None
+    fetch_key: str
+    notes_placeholder: bool = False
 
 
 def start_dead_link_job(
@@ -96,6 +118,47 @@ def clear_dead_link_job_runtime(job_id: int) -> None:
         _STOP_REQUESTED.discard(job_id)
 
 
+def check_bookmark_links(app: Flask, bookmarks: Iterable[Bookmark]) -> None:
+    external: list[Bookmark] = []
+    for bookmark in bookmarks:
+        if bookmark_is_internal(bookmark):
+            set_internal_link_status(bookmark)
+        else:
+            external.append(bookmark)
+    if not external:
+        return
+
+    timeout = app.config["CONTENT_FETCH_TIMEOUT"]
+    max_workers = int(app.config.get("DEAD_LINK_WORKERS", 12))
+    max_workers = max(1, min(max_workers, len(external)))
+    # Checks run concurrently; the session is only used on the calling thread.
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(
+            executor.map(
+                lambda url: check_link(url, timeout=timeout),
+                [bookmark.url for bookmark in external],
+            )
+        )
+
+    now = utcnow()
+    check_rows = []
+    for bookmark, result in zip(external, results, strict=True):
+        bookmark.link_status = result.result_type
+        bookmark.last_checked_at = now
+        check_rows.append(
+            {
+                "bookmark_id": bookmark.id,
+                "checked_at": now,
+                "status_code": result.status_code,
+                "final_url": result.final_url,
+                "result_type": result.result_type,
+                "latency_ms": result.latency_ms,
+                "error": result.error,
+            }
+        )
+    _insert_link_checks(check_rows)
+
+
 def _run_dead_link_job(
     app: Flask,
     user_id: int,
@@ -104,6 +167,10 @@ def _run_dead_link_job(
 ) -> None:
     with app.app_context():
         db.session.remove()
+        # This session belongs to the job thread only and is discarded at the
+        # end, so objects loaded here can safely outlive each commit without
+        # being reloaded.
+        db.session().expire_on_commit = False
         started_at = utcnow()
         _runtime_update(
             job_id,
@@ -113,6 +180,7 @@ def _run_dead_link_job(
             },
         )
 
+        job = None
         try:
             job = DeadLinkJob.query.filter_by(id=job_id, user_id=user_id).first()
             if not job:
@@ -120,7 +188,7 @@ def _run_dead_link_job(
 
             if _stop_requested(job_id):
                 _finish_job(
-                    job_id=job_id,
+                    job,
                     started_at=started_at,
                     status="stopped",
                     error_message="Stopped by user.",
@@ -141,7 +209,7 @@ def _run_dead_link_job(
             total_targets = len(targets)
             if total_targets == 0:
                 _finish_job(
-                    job_id=job_id,
+                    job,
                     started_at=started_at,
                     status="done",
                     error_message="No bookmarks need checking.",
@@ -154,114 +222,107 @@ def _run_dead_link_job(
             timeout = float(app.config["CONTENT_FETCH_TIMEOUT"])
             max_bytes = int(app.config["CONTENT_MAX_BYTES"])
             max_workers = int(app.config.get("DEAD_LINK_WORKERS", 12))
-            max_workers = max(2, min(max_workers, 24))
+            max_workers = max(2, max_workers)
+            per_host_limit = max(1, int(app.config.get("DEAD_LINK_PER_HOST_LIMIT", 4)))
 
             checked = 0
             alive = 0
             problematic = 0
             errors = 0
 
+            # Bookmarks sharing a URL are fetched once and all receive the result.
+            target_groups: dict[str, list[_LinkTarget]] = {}
+            for target in targets:
+                target_groups.setdefault(target.fetch_key, []).append(target)
+
             executor = ThreadPoolExecutor(max_workers=max_workers)
-            futures = {
-                executor.submit(
+
+            def submit_group(group: list[_LinkTarget]) -> Future[ExtractedContent]:
+                return executor.submit(
                     fetch_and_extract,
-                    target.url,
+                    group[0].url,
                     timeout=timeout,
                     max_bytes=max_bytes,
-                ): target
-                for target in targets
-            }
+                )
+
+            check_rows: list[dict] = []
+            pending_results: list[tuple[_LinkTarget, ExtractedContent]] = []
             stop_job = False
+            last_commit_at = time.monotonic()
+
+            def store_pending_results() -> None:
+                nonlocal alive, problematic, errors
+                failures = _store_check_results(pending_results, check_rows)
+                for extracted, exc in failures:
+                    # A result that cannot be stored counts as an unreachable
+                    # error, as if the fetch itself had failed.
+                    if extracted.status not in PROBLEMATIC_RESULTS:
+                        alive -= 1
+                        problematic += 1
+                    if not extracted.error:
+                        errors += 1
+                    _runtime_update(
+                        job_id,
+                        {
+                            "status_message": (
+                                f"Failed to store check result: {str(exc)[:140]}"
+                            )
+                        },
+                    )
+                if failures:
+                    job.total_alive = alive
+                    job.total_problematic = problematic
+                    job.total_errors = errors
+                _insert_link_checks(check_rows)
+
             try:
-                for future in as_completed(futures):
+                for future, group in _iter_completed(
+                    submit_group,
+                    target_groups.values(),
+                    max_in_flight=max_workers * 2,
+                    per_host_limit=per_host_limit,
+                ):
                     if _stop_requested(job_id):
                         stop_job = True
                         break
 
-                    target = futures[future]
                     extracted = _resolve_future(future)
-                    status_message = f"Checked {target.url}"
-                    try:
-                        bookmark = Bookmark.query.filter_by(
-                            id=target.bookmark_id,
-                            user_id=user_id,
-                        ).first()
-                        if bookmark:
-                            bookmark.link_status = extracted.status
-                            bookmark.last_checked_at = utcnow()
-                            content = bookmark.content or BookmarkContent(
-                                bookmark_id=bookmark.id
-                            )
-                            content.extracted_text = extracted.text
-                            content.extracted_at = utcnow()
-                            content.fetch_status = extracted.status
-                            content.fetch_error = extracted.error
-                            content.content_hash = hashlib.sha256(
-                                extracted.text.encode("utf-8")
-                            ).hexdigest()
-
-                            extracted_notes = (extracted.text or "").strip()
-                            if extracted_notes:
-                                bookmark.notes = extracted_notes
-                            elif (bookmark.notes or "").strip().lower() == "none":
-                                bookmark.notes = None
-
-                            db.session.add(content)
-                            check = LinkCheck()
-                            check.bookmark_id = bookmark.id
-                            check.status_code = extracted.status_code
-                            check.final_url = extracted.final_url
-                            check.result_type = extracted.status
-                            check.latency_ms = None
-                            check.error = extracted.error
-                            db.session.add(check)
-                            db.session.commit()
-                    except Exception as exc:
-                        db.session.rollback()
-                        extracted = ExtractedContent(
-                            title=None,
-                            text="",
-                            status=LINK_STATUS_UNREACHABLE,
-                            error=str(exc),
-                            status_code=None,
-                            final_url=None,
-                        )
-                        status_message = (
-                            f"Failed to store check result: {str(exc)[:140]}"
+                    for target in group:
+                        pending_results.append((target, extracted))
+                        checked += 1
+                        if extracted.status in PROBLEMATIC_RESULTS:
+                            problematic += 1
+                        else:
+                            alive += 1
+                        if extracted.error:
+                            errors += 1
+
+                        _persist_progress(
+                            job,
+                            checked=checked,
+                            total=total_targets,
+                            alive=alive,
+                            problematic=problematic,
+                            errors=errors,
+                            started_at=started_at,
+                            current_title=target.title,
+                            current_url=target.url,
+                            status_message=f"Checked {target.url}",
                         )
-
-                    checked += 1
-                    if extracted.status in PROBLEMATIC_RESULTS:
-                        problematic += 1
-                    else:
-                        alive += 1
-                    if extracted.error:
-                        errors += 1
-
-                    _persist_progress(
-                        job_id=job_id,
-                        checked=checked,
-                        total=total_targets,
-                        alive=alive,
-                        problematic=problematic,
-                        errors=errors,
-                        started_at=started_at,
-                        current_title=target.title,
-                        current_url=target.url,
-                        status_message=status_message,
-                    )
+                        if (
+                            checked % _COMMIT_INTERVAL == 0
+                            or time.monotonic() - last_commit_at >= _COMMIT_SECONDS
+                        ):
+                            store_pending_results()
+                            db.session.commit()
+                            last_commit_at = time.monotonic()
             finally:
-                if stop_job:
-                    for pending in futures:
-                        if not pending.done():
-                            pending.cancel()
-                    executor.shutdown(wait=False, cancel_futures=True)
-                else:
-                    executor.shutdown(wait=True)
+                executor.shutdown(wait=not stop_job, cancel_futures=stop_job)
 
+            store_pending_results()
             if stop_job:
                 _finish_job(
-                    job_id=job_id,
+                    job,
                     started_at=started_at,
                     status="stopped",
                     error_message="Stopped by user.",
@@ -272,19 +333,20 @@ def _run_dead_link_job(
             if errors:
                 completion_message = f"Finished with {errors} request/storage errors."
             _finish_job(
-                job_id=job_id,
+                job,
                 started_at=started_at,
                 status="done",
                 error_message=completion_message,
             )
         except Exception as exc:
             db.session.rollback()
-            _finish_job(
-                job_id=job_id,
-                started_at=started_at,
-                status="failed",
-                error_message=str(exc),
-            )
+            if job is not None:
+                _finish_job(
+                    job,
+                    started_at=started_at,
+                    status="failed",
+                    error_message=str(exc),
+                )
         finally:
             db.session.remove()
 
@@ -293,31 +355,157 @@ def _load_targets(
     user_id: int,
     bookmark_ids: list[int] | None = None,
 ) -> list[_LinkTarget]:
-    query = (
-        Bookmark.query.filter_by(user_id=user_id)
-        .filter(Bookmark.deleted_at.is_(None))
-        .options(joinedload(Bookmark.tags))
-        .order_by(Bookmark.last_checked_at.is_not(None), Bookmark.last_checked_at.asc())
-    )
-
+    conditions = [Bookmark.user_id == user_id, Bookmark.deleted_at.is_(None)]
     if bookmark_ids:
         unique_ids = list(dict.fromkeys(bookmark_ids))
-        query = query.filter(Bookmark.id.in_(unique_ids))
-
-    rows = query.all()
-    targets: list[_LinkTarget] = []
-    touched_internal = False
-    for row in rows:
-        if bookmark_is_internal(row):
-            set_internal_link_status(row)
-            touched_internal = True
-            continue
-        targets.append(_LinkTarget(bookmark_id=row.id, url=row.url, title=row.title))
-
-    if touched_internal:
+        conditions.append(Bookmark.id.in_(unique_ids))
+
+    internal_result = db.session.execute(
+        update(Bookmark)
+        .where(*conditions, internal_bookmark_clause())
+        .values(link_status=INTERNAL_LINK_STATUS, last_checked_at=utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    if internal_result.rowcount:
         db.session.commit()
 
-    return targets
+    # Notes stay deferred; only whether they hold the legacy "None" placeholder
+    # is needed when a fetch returns no text.
+    notes_placeholder = func.lower(func.trim(Bookmark.notes)) == "none"
+    rows = (
+        Bookmark.query.filter(*conditions, ~internal_bookmark_clause())
+        .add_columns(notes_placeholder)
+        .options(
+            selectinload(Bookmark.content).load_only(BookmarkContent.content_hash),
+            defer(Bookmark.notes),
+        )
+        .order_by(Bookmark.last_checked_at.is_not(None), Bookmark.last_checked_at.asc())
+        .all()
+    )
+    return [
+        _LinkTarget(
+            bookmark=row,
+            url=row.url,
+            title=row.title,
+            fetch_key=row.normalized_url or normalize_url(row.url),
+            notes_placeholder=bool(placeholder),
+        )
+        for row, placeholder in rows
+    ]
+
+
+def _store_check_result(target: _LinkTarget, extracted: ExtractedContent) -> dict:
+    bookmark = target.bookmark
+    now = utcnow()
+    bookmark.link_status = extracted.status
+    bookmark.last_checked_at = now
+    content = bookmark.content or BookmarkContent(bookmark_id=bookmark.id)
+    if content.content_hash is None or content.content_hash != extracted.content_hash:
+        content.extracted_text = extracted.text
+        content.extracted_at = now
+        content.content_hash = extracted.content_hash
+    content.fetch_status = extracted.status
+    content.fetch_error = extracted.error
+
+    extracted_notes = (extracted.text or "").strip()
+    if extracted_notes:
+        bookmark.notes = extracted_notes
+    elif target.notes_placeholder:
+        bookmark.notes = None
+
+    db.session.add(content)
+    return {
+        "bookmark_id": bookmark.id,
+        "checked_at": now,
+        "status_code": extracted.status_code,
+        "final_url": extracted.final_url,
+        "result_type": extracted.status,
+        "latency_ms": None,
+        "error": extracted.error,
+    }
+
+
+def _store_check_results(
+    results: list[tuple[_LinkTarget, ExtractedContent]],
+    check_rows: list[dict],
+) -> list[tuple[ExtractedContent, Exception]]:
+    failures: list[tuple[ExtractedContent, Exception]] = []
+    try:
+        with db.session.begin_nested():
+            rows = [
+                _store_check_result(target, extracted)
+                for target, extracted in results
+            ]
+    except Exception:
+        rows = []
+        for target, extracted in results:
+            try:
+                with db.session.begin_nested():
+                    rows.append(_store_check_result(target, extracted))
+            except Exception as exc:
+                failures.append((extracted, exc))
+    check_rows.extend(rows)
+    results.clear()
+    return failures
+
+
+def _insert_link_checks(rows: list[dict]) -> None:
+    # Check rows are append-only, so they skip the unit of work and go out as
+    # a single executemany INSERT per batch.
+    if rows:
+        db.session.execute(insert(LinkCheck), rows)
+        rows.clear()
+
+
+def _iter_completed(
+    submit: Callable[[list[_LinkTarget]], Future[ExtractedContent]],
+    groups: Iterable[list[_LinkTarget]],
+    max_in_flight: int,
+    per_host_limit: int,
+) -> Iterator[tuple[Future[ExtractedContent], list[_LinkTarget]]]:
+    # Keeps a bounded number of fetches queued instead of submitting every
+    # target up front, so large jobs hold few futures and stop promptly.
+    # Hosts are capped here, before submitting, so one slow or large site
+    # cannot take over the pool and no worker thread waits on a busy host.
+    pending = iter(groups)
+    in_flight: dict[Future[ExtractedContent], tuple[str, list[_LinkTarget]]] = {}
+    host_active: Counter[str] = Counter()
+    host_queues: dict[str, deque[list[_LinkTarget]]] = {}
+    ready_hosts: deque[str] = deque()
+
+    def next_group() -> tuple[str, list[_LinkTarget]] | None:
+        while ready_hosts:
+            host = ready_hosts.popleft()
+            queue = host_queues.get(host)
+            if queue and host_active[host] < per_host_limit:
+                group = queue.popleft()
+                if not queue:
+                    del host_queues[host]
+                return host, group
+        for group in pending:
+            host = urlsplit(group[0].fetch_key).netloc
+            if host_active[host] < per_host_limit:
+                return host, group
+            host_queues.setdefault(host, deque()).append(group)
+        return None
+
+    while True:
+        while len(in_flight) < max_in_flight:
+            item = next_group()
+            if item is None:
+                break
+            host, group = item
+            host_active[host] += 1
+            in_flight[submit(group)] = (host, group)
+        if not in_flight:
+            return
+        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in done:
+            host, group = in_flight.pop(future)
+            host_active[host] -= 1
+            if host in host_queues:
+                ready_hosts.append(host)
+            yield future, group
 
 
 def _resolve_future(future: Future[ExtractedContent]) -> ExtractedContent:
@@ -335,7 +523,7 @@ def _resolve_future(future: Future[ExtractedContent]) -> ExtractedContent:
 
 
 def _persist_progress(
-    job_id: int,
+    job: DeadLinkJob,
     checked: int,
     total: int,
     alive: int,
@@ -346,17 +534,14 @@ def _persist_progress(
     current_url: str,
     status_message: str,
 ) -> None:
-    job = DeadLinkJob.query.filter_by(id=job_id).first()
-    if job:
-        job.progress = int((checked / total) * 100) if total else 100
-        job.total_checked = checked
-        job.total_alive = alive
-        job.total_problematic = problematic
-        job.total_errors = errors
-        db.session.commit()
+    job.progress = int((checked / total) * 100) if total else 100
+    job.total_checked = checked
+    job.total_alive = alive
+    job.total_problematic = problematic
+    job.total_errors = errors
 
     _runtime_update(
-        job_id,
+        job.id,
         {
             "started_at": started_at,
             "current_title": current_title,
@@ -369,15 +554,11 @@ def _persist_progress(
 
 
 def _finish_job(
-    job_id: int,
+    job: DeadLinkJob,
     started_at: datetime,
     status: str,
     error_message: str | None,
 ) -> None:
-    job = DeadLinkJob.query.filter_by(id=job_id).first()
-    if not job:
-        return
-
     job.status = status
     if job.total_targets:
         job.progress = int((job.total_checked / job.total_targets) * 100)
@@ -387,7 +568,7 @@ def _finish_job(
     db.session.commit()
 
     _runtime_update(
-        job_id,
+        job.id,
         {
             "started_at": started_at,
             "finished_at": utcnow(),
@@ -397,7 +578,7 @@ def _finish_job(
         },
     )
     with _RUNTIME_LOCK:
-        _STOP_REQUESTED.discard(job_id)
+        _STOP_REQUESTED.discard(job.id)
 
 
 def _stop_requested(job_id: int) -> bool:
@@ -407,9 +588,7 @@ def _stop_requested(job_id: int) -> bool:
 
 def _runtime_update(job_id: int, updates: dict) -> None:
     with _RUNTIME_LOCK:
-        state = _RUNTIME_STATE.get(job_id, {}).copy()
-        state.update(updates)
-        _RUNTIME_STATE[job_id] = state
+        _RUNTIME_STATE.setdefault(job_id, {}).update(updates)
 
 
 def _runtime_snapshot(job_id: int) -> dict:
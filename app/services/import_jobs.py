@@ -1,16 +1,18 @@
 from __future__ import annotations
 
-import hashlib
+import os
+import tempfile
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime
 
 from flask import Flask
+from werkzeug.datastructures import FileStorage
 
 from app.extensions import db
 from app.models import Bookmark, BookmarkContent, Folder, ImportJob, utcnow
-from app.services.bookmark_import import ImportedBookmark, parse_bookmark_html
+from app.services.bookmark_import import ImportedBookmark, iter_bookmark_html
 from app.services.common import normalize_url
 from app.services.content import (
     ExtractedContent,
@@ -36,10 +38,19 @@ class _WorkItem:
     bookmark_id: int | None = None
 
 
-def start_import_job(app: Flask, user_id: int, job_id: int, html: str) -> None:
+def spool_import_upload(upload: FileStorage) -> str:
+    # Uploads are copied to disk in chunks and parsed from there by the job,
+    # so a large export is never held in memory as one string.
+    handle, path = tempfile.mkstemp(prefix="linkloom-import-", suffix=".html")
+    with os.fdopen(handle, "wb") as spool:
+        upload.save(spool)
+    return path
+
+
+def start_import_job(app: Flask, user_id: int, job_id: int, path: str) -> None:
     thread = threading.Thread(
         target=_run_import_job,
-        args=(app, user_id, job_id, html),
+        args=(app, user_id, job_id, path),
         daemon=True,
         name=f"import-job-{job_id}",
     )
@@ -51,6 +62,8 @@ def get_import_job_details(job: ImportJob) -> dict:
     runtime = _runtime_snapshot(job.id)
     payload.update(
         {
+            "total_created": runtime.get("total_created", job.total_created),
+            "total_skipped": runtime.get("total_skipped", job.total_skipped),
             "processed_items": runtime.get("processed_items", 0),
             "total_items": runtime.get("total_items", 0),
             "total_failed": runtime.get("total_failed", 0),
@@ -67,7 +80,7 @@ def get_import_job_details(job: ImportJob) -> dict:
     return payload
 
 
-def _run_import_job(app: Flask, user_id: int, job_id: int, html: str) -> None:
+def _run_import_job(app: Flask, user_id: int, job_id: int, path: str) -> None:
     with app.app_context():
         db.session.remove()
         started_at = utcnow()
@@ -95,7 +108,8 @@ def _run_import_job(app: Flask, user_id: int, job_id: int, html: str) -> None:
             job.error_message = None
             db.session.commit()
 
-            entries = parse_bookmark_html(html)
+            with open(path, "rb") as upload:
+                entries = list(iter_bookmark_html(upload))
             total_items = len(entries)
             _runtime_update(job_id, {"total_items": total_items})
 
@@ -205,6 +219,10 @@ def _run_import_job(app: Flask, user_id: int, job_id: int, html: str) -> None:
             _finish_job(job_id, "failed", started_at, str(exc))
         finally:
             db.session.remove()
+            try:
+                os.remove(path)
+            except OSError:
+                pass
 
 
 def _finish_job(
@@ -339,6 +357,7 @@ def _create_bookmark(
     extracted: ExtractedContent,
 ) -> None:
     notes_text = (extracted.text or "").strip() or None
+    now = utcnow()
     bookmark = Bookmark(
         user_id=user_id,
         folder_id=folder_id,
@@ -347,10 +366,12 @@ def _create_bookmark(
         title=entry.title or None,
         notes=notes_text,
         link_status=extracted.status,
+        created_at=now,
+        updated_at=now,
     )
     db.session.add(bookmark)
     db.session.flush()
-    _apply_extracted_content(bookmark, extracted)
+    _apply_extracted_content(bookmark, extracted, now=now)
     log_sync_event(
         user_id,
         "bookmark",
@@ -400,19 +421,24 @@ def _restore_bookmark(
     return True
 
 
-def _apply_extracted_content(bookmark: Bookmark, extracted: ExtractedContent) -> None:
+def _apply_extracted_content(
+    bookmark: Bookmark,
+    extracted: ExtractedContent,
+    now: datetime | None = None,
+) -> None:
     if bookmark_is_internal(bookmark):
         set_internal_link_status(bookmark)
         return
 
+    now = now or utcnow()
     content = bookmark.content or BookmarkContent(bookmark_id=bookmark.id)
     bookmark.link_status = extracted.status
-    bookmark.last_checked_at = utcnow()
+    bookmark.last_checked_at = now
     content.extracted_text = extracted.text
-    content.extracted_at = utcnow()
+    content.extracted_at = now
     content.fetch_status = extracted.status
     content.fetch_error = extracted.error
-    content.content_hash = hashlib.sha256(extracted.text.encode("utf-8")).hexdigest()
+    content.content_hash = extracted.content_hash
     db.session.add(content)
 
 
@@ -442,16 +468,23 @@ def _persist_progress(
     current_url: str | None,
     status_message: str,
 ) -> None:
-    job = ImportJob.query.filter_by(id=job_id).first()
-    if job:
-        job.progress = int((processed / total) * 100) if total else 100
-        job.total_created = created
-        job.total_skipped = skipped
-        db.session.commit()
+    # The job row is only written when the whole percentage moves; the live
+    # counters in between are served from the runtime state.
+    progress = processed * 100 // total if total else 100
+    with _RUNTIME_LOCK:
+        previous_progress = _RUNTIME_STATE.get(job_id, {}).get("progress")
+    if progress != previous_progress:
+        job = ImportJob.query.filter_by(id=job_id).first()
+        if job:
+            job.progress = progress
+            job.total_created = created
+            job.total_skipped = skipped
+            db.session.commit()
 
     _runtime_update(
         job_id,
         {
+            "progress": progress,
             "processed_items": processed,
             "total_items": total,
             "total_created": created,
@@ -467,9 +500,7 @@ def _persist_progress(
 
 def _runtime_update(job_id: int, updates: dict) -> None:
     with _RUNTIME_LOCK:
-        state = _RUNTIME_STATE.get(job_id, {}).copy()
-        state.update(updates)
-        _RUNTIME_STATE[job_id] = state
+        _RUNTIME_STATE.setdefault(job_id, {}).update(updates)
 
 
 def _runtime_snapshot(job_id: int) -> dict:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from app.models import Bookmark, utcnow
+from app.extensions import db
+from app.models import Bookmark, Tag, utcnow
 
 INTERNAL_LINK_TAG = "internal"
 INTERNAL_LINK_STATUS = "N/A"
@@ -12,6 +13,11 @@ def bookmark_is_internal(bookmark: Bookmark) -> bool:
     )
 
 
+def internal_bookmark_clause():
+    # SQL counterpart of bookmark_is_internal for bulk queries.
+    return Bookmark.tags.any(db.func.lower(db.func.trim(Tag.name)) == INTERNAL_LINK_TAG)
+
+
 def set_internal_link_status(bookmark: Bookmark) -> None:
     bookmark.link_status = INTERNAL_LINK_STATUS
     bookmark.last_checked_at = utcnow()
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+from collections import defaultdict
+
 from rapidfuzz import fuzz
+from sqlalchemy.orm import joinedload, selectinload
+
+from app.extensions import db
+from app.models import Bookmark, BookmarkContent, Tag, bookmark_tags
 
 
 def _safe(value: str | None) -> str:
@@ -8,11 +14,26 @@ def _safe(value: str | None) -> str:
 
 
 def score_bookmark(bookmark, query: str) -> tuple[float, list[str]]:
+    return score_fields(
+        query,
+        title=bookmark.title,
+        notes=getattr(bookmark, "notes", ""),
+        tags=" ".join(tag.name for tag in bookmark.tags),
+        content=bookmark.content.extracted_text if bookmark.content else "",
+    )
+
+
+def score_fields(
+    query: str,
+    title: str | None,
+    notes: str | None,
+    tags: str,
+    content: str | None,
+) -> tuple[float, list[str]]:
     q = query.strip().lower()
-    title = _safe(bookmark.title)
-    notes = _safe(getattr(bookmark, "notes", ""))
-    tags = " ".join(tag.name for tag in bookmark.tags)
-    content = _safe(bookmark.content.extracted_text if bookmark.content else "")
+    title = _safe(title)
+    notes = _safe(notes)
+    content = _safe(content)
 
     score = 0.0
     reasons: list[str] = []
@@ -83,3 +104,57 @@ def search_bookmarks(bookmarks, query: str, limit: int = 50):
 
     ranked.sort(key=lambda item: item["score"], reverse=True)
     return ranked[:limit]
+
+
+def search_user_bookmarks(user_id: int, query: str, limit: int = 50):
+    if not query or not query.strip():
+        return []
+
+    tag_names: dict[int, list[str]] = defaultdict(list)
+    tag_rows = (
+        db.session.query(bookmark_tags.c.bookmark_id, Tag.name)
+        .join(Tag, Tag.id == bookmark_tags.c.tag_id)
+        .filter(Tag.user_id == user_id)
+    )
+    for bookmark_id, name in tag_rows:
+        tag_names[bookmark_id].append(name)
+
+    # Scores are computed from plain column rows streamed from the database;
+    # only the bookmarks that make the cut are loaded as full objects.
+    rows = (
+        db.session.query(
+            Bookmark.id,
+            Bookmark.title,
+            Bookmark.notes,
+            BookmarkContent.extracted_text,
+        )
+        .outerjoin(BookmarkContent, BookmarkContent.bookmark_id == Bookmark.id)
+        .filter(Bookmark.user_id == user_id, Bookmark.deleted_at.is_(None))
+        .order_by(Bookmark.updated_at.desc())
+        .yield_per(1000)
+    )
+    ranked = []
+    for bookmark_id, title, notes, content in rows:
+        score, reasons = score_fields(
+            query,
+            title=title,
+            notes=notes,
+            tags=" ".join(tag_names.get(bookmark_id, ())),
+            content=content,
+        )
+        if reasons and score > 0:
+            ranked.append((bookmark_id, round(score, 2), reasons))
+
+    ranked.sort(key=lambda item: item[1], reverse=True)
+    ranked = ranked[:limit]
+    bookmarks = {
+        bookmark.id: bookmark
+        for bookmark in Bookmark.query.filter(
+            Bookmark.id.in_([bookmark_id for bookmark_id, _, _ in ranked])
+        ).options(selectinload(Bookmark.tags), joinedload(Bookmark.folder))
+    }
+    return [
+        {"bookmark": bookmarks[bookmark_id], "score": score, "reasons": reasons}
+        for bookmark_id, score, reasons in ranked
+        if bookmark_id in bookmarks
+    ]
@@ -1,11 +1,26 @@
 import hashlib
+from datetime import timedelta, timezone
 from functools import wraps
 
-from flask import g, jsonify, request
+from flask import current_app, g, jsonify, request
 from flask_login import current_user
+from sqlalchemy.orm import joinedload
 
 from app.extensions import db
-from app.models import ApiToken, utcnow
+from app.models import ApiToken, User, utcnow
+
+# last_used_at is informational, so it is refreshed at most this often instead
+# of costing a write and a commit on every API request.
+LAST_USED_RESOLUTION = timedelta(minutes=1)
+
+
+def bootstrap_completed() -> bool:
+    # Users are never removed, so once one exists the answer cannot change and
+    # the per-request first-run check can skip the COUNT query.
+    state = current_app.extensions.setdefault("linkloom", {})
+    if not state.get("bootstrap_completed"):
+        state["bootstrap_completed"] = User.query.count() > 0
+    return state["bootstrap_completed"]
 
 
 def _user_from_bearer_token():
@@ -16,11 +31,20 @@ def _user_from_bearer_token():
     if not token:
         return None
     token_hash = hashlib.sha256(token.encode("utf-8")).hexdigest()
-    token_row = ApiToken.query.filter_by(token_hash=token_hash).first()
+    token_row = (
+        ApiToken.query.options(joinedload(ApiToken.user))
+        .filter_by(token_hash=token_hash)
+        .first()
+    )
     if not token_row or token_row.revoked_at is not None:
         return None
-    token_row.last_used_at = utcnow()
-    db.session.commit()
+    now = utcnow()
+    last_used_at = token_row.last_used_at
+    if last_used_at is not None and last_used_at.tzinfo is None:
+        last_used_at = last_used_at.replace(tzinfo=timezone.utc)
+    if last_used_at is None or now - last_used_at >= LAST_USED_RESOLUTION:
+        token_row.last_used_at = now
+        db.session.commit()
     return token_row.user
 
 
@@ -4,9 +4,19 @@ from datetime import datetime, timezone
 
 from dateutil import parser as dt_parser
 from itsdangerous import BadData, URLSafeTimedSerializer
+from sqlalchemy import delete
 
 from app.extensions import db
-from app.models import Bookmark, Folder, SyncClient, SyncEvent, Tag, utcnow
+from app.models import (
+    Bookmark,
+    BookmarkContent,
+    Folder,
+    SyncClient,
+    SyncEvent,
+    Tag,
+    bookmark_tags,
+    utcnow,
+)
 from app.services.common import normalize_url, parse_tags
 
 
@@ -139,10 +149,12 @@ def _parse_client_time(value: str | None):
 
 
 def _normalize_notes_value(value) -> str | None:
-    text = (value or "").strip()
+    if not value:
+        return None
+    text = value.strip()
     if not text:
         return None
-    if text.lower() == "none":
+    if len(text) == 4 and text.lower() == "none":
         return None
     return text
 
@@ -167,6 +179,18 @@ def _apply_tags(user_id: int, bookmark: Bookmark, tag_names: list[str]):
         bookmark.tags.append(tag)
 
 
+def purge_bookmark_rows(bookmark_ids: list[int]) -> None:
+    if not bookmark_ids:
+        return
+    db.session.execute(
+        delete(BookmarkContent).where(BookmarkContent.bookmark_id.in_(bookmark_ids))
+    )
+    db.session.execute(
+        delete(bookmark_tags).where(bookmark_tags.c.bookmark_id.in_(bookmark_ids))
+    )
+    db.session.execute(delete(Bookmark).where(Bookmark.id.in_(bookmark_ids)))
+
+
 def _delete_folder_tree_for_sync(user, folder: Folder) -> None:
     for child in list(folder.children):
         _delete_folder_tree_for_sync(user, child)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import hashlib
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -117,9 +116,7 @@ def _run_sync_first_replace_server_enrichment(
                         content.extracted_at = utcnow()
                         content.fetch_status = extracted.status
                         content.fetch_error = extracted.error
-                        content.content_hash = hashlib.sha256(
-                            extracted.text.encode("utf-8")
-                        ).hexdigest()
+                        content.content_hash = extracted.content_hash
 
                         extracted_notes = _normalize_notes_value(extracted.text)
                         if extracted_notes:
@@ -142,9 +139,11 @@ def _run_sync_first_replace_server_enrichment(
 
 
 def _normalize_notes_value(value: str | None) -> str | None:
-    text = (value or "").strip()
+    if not value:
+        return None
+    text = value.strip()
     if not text:
         return None
-    if text.lower() == "none":
+    if len(text) == 4 and text.lower() == "none":
         return None
     return text
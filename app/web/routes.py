@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import html
-import hashlib
 
 from flask import (
     Response,
@@ -17,7 +16,7 @@ from flask import (
 )
 from flask_login import current_user, login_required
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectinload
 
 from app.extensions import db
 from app.models import (
@@ -34,13 +33,17 @@ from app.models import (
 from app.services.common import normalize_url, parse_tags
 from app.services.content import fetch_and_extract
 from app.services.dead_link_jobs import (
-    PROBLEMATIC_RESULTS,
+    PROBLEMATIC_RESULT_VALUES,
     clear_dead_link_job_runtime,
     get_dead_link_job_details,
     request_dead_link_job_stop,
     start_dead_link_job,
 )
-from app.services.import_jobs import get_import_job_details, start_import_job
+from app.services.import_jobs import (
+    get_import_job_details,
+    spool_import_upload,
+    start_import_job,
+)
 from app.services.internal_links import (
     INTERNAL_LINK_STATUS,
     INTERNAL_LINK_TAG,
@@ -48,8 +51,10 @@ from app.services.internal_links import (
     set_internal_link_status,
 )
 from app.services.search import search_bookmarks
+from app.services.security import bootstrap_completed
 from app.services.sync import (
     log_sync_event,
+    purge_bookmark_rows,
     serialize_bookmark_for_sync,
     serialize_folder_for_sync,
 )
@@ -128,6 +133,7 @@ def _selected_active_bookmarks(bookmark_ids: list[int]) -> list[Bookmark]:
         Bookmark.query.filter_by(user_id=current_user.id)
         .filter(Bookmark.deleted_at.is_(None))
         .filter(Bookmark.id.in_(bookmark_ids))
+        .options(selectinload(Bookmark.tags))
         .all()
     )
 
@@ -136,7 +142,7 @@ def _selected_active_bookmarks(bookmark_ids: list[int]) -> list[Bookmark]:
 def first_run_gate():
     endpoint = request.endpoint or ""
     allowed_prefixes = {"static", "auth.bootstrap_admin", "auth.login"}
-    if User.query.count() == 0 and endpoint not in allowed_prefixes:
+    if endpoint not in allowed_prefixes and not bootstrap_completed():
         return redirect(url_for("auth.bootstrap_admin"))
 
 
@@ -151,10 +157,12 @@ def _assign_tags(bookmark: Bookmark, raw_tags: str):
 
 
 def _normalize_notes_value(value: str | None) -> str | None:
-    text = (value or "").strip()
+    if not value:
+        return None
+    text = value.strip()
     if not text:
         return None
-    if text.lower() == "none":
+    if len(text) == 4 and text.lower() == "none":
         return None
     return text
 
@@ -173,10 +181,11 @@ def _refresh_content(bookmark: Bookmark, populate_notes: bool = False):
     if extracted.title and not bookmark.title:
         bookmark.title = extracted.title
 
+    now = utcnow()
     bookmark.link_status = extracted.status
-    bookmark.last_checked_at = utcnow()
+    bookmark.last_checked_at = now
     content.extracted_text = extracted.text
-    content.extracted_at = utcnow()
+    content.extracted_at = now
     content.fetch_status = extracted.status
     content.fetch_error = extracted.error
     if populate_notes:
@@ -185,7 +194,7 @@ def _refresh_content(bookmark: Bookmark, populate_notes: bool = False):
             bookmark.notes = extracted_notes
         elif _normalize_notes_value(bookmark.notes) is None:
             bookmark.notes = None
-    content.content_hash = hashlib.sha256(extracted.text.encode("utf-8")).hexdigest()
+    content.content_hash = extracted.content_hash
     db.session.add(content)
 
 
@@ -477,7 +486,7 @@ def _bookmarks_query_for_current_user(
     status: str | None,
 ):
     query = Bookmark.query.options(
-        joinedload(Bookmark.tags),
+        selectinload(Bookmark.tags),
         joinedload(Bookmark.folder),
     ).filter_by(user_id=current_user.id)
     query = query.filter(Bookmark.deleted_at.is_(None))
@@ -518,18 +527,21 @@ def dashboard():
     total = (
         Bookmark.query.filter_by(user_id=current_user.id)
         .filter(Bookmark.deleted_at.is_(None))
-        .count()
+        .with_entities(db.func.count(Bookmark.id))
+        .scalar()
     )
     deleted = (
         Bookmark.query.filter_by(user_id=current_user.id)
         .filter(Bookmark.deleted_at.is_not(None))
-        .count()
+        .with_entities(db.func.count(Bookmark.id))
+        .scalar()
     )
     dead = (
         Bookmark.query.filter_by(user_id=current_user.id)
         .filter(Bookmark.deleted_at.is_(None))
-        .filter(Bookmark.link_status.in_(list(PROBLEMATIC_RESULTS)))
-        .count()
+        .filter(Bookmark.link_status.in_(PROBLEMATIC_RESULT_VALUES))
+        .with_entities(db.func.count(Bookmark.id))
+        .scalar()
     )
     recent = (
         Bookmark.query.filter_by(user_id=current_user.id)
@@ -839,8 +851,9 @@ def bookmarks_delete_selected():
     rows = _selected_active_bookmarks(bookmark_ids)
 
     deleted_count = 0
+    now = utcnow()
     for item in rows:
-        item.deleted_at = utcnow()
+        item.deleted_at = now
         item.deleted_by = current_user.id
         log_sync_event(
             current_user.id,
@@ -1184,6 +1197,7 @@ def folders_delete_web(folder_id: int):
     bookmark_rows = (
         Bookmark.query.filter_by(user_id=current_user.id)
         .filter(Bookmark.folder_id.in_(subtree_ids))
+        .options(selectinload(Bookmark.tags))
         .all()
     )
     active_bookmark_count = sum(1 for row in bookmark_rows if row.deleted_at is None)
@@ -1196,10 +1210,11 @@ def folders_delete_web(folder_id: int):
         )
 
     deleted_bookmarks = 0
+    now = utcnow()
     for bookmark in bookmark_rows:
         bookmark.folder_id = None
         if bookmark.deleted_at is None:
-            bookmark.deleted_at = utcnow()
+            bookmark.deleted_at = now
             bookmark.deleted_by = current_user.id
             log_sync_event(
                 current_user.id,
@@ -1284,11 +1299,8 @@ def recycle_purge(bookmark_id: int):
     item = Bookmark.query.filter_by(
         id=bookmark_id, user_id=current_user.id
     ).first_or_404()
-    if item.content:
-        db.session.delete(item.content)
-    item.tags.clear()
     log_sync_event(current_user.id, "bookmark", item.id, "purge", {"id": item.id})
-    db.session.delete(item)
+    purge_bookmark_rows([item.id])
     db.session.commit()
     flash("Bookmark permanently deleted.", "success")
     return redirect(url_for("web.recycle_bin"))
@@ -1297,19 +1309,17 @@ def recycle_purge(bookmark_id: int):
 @web_bp.route("/recycle-bin/empty", methods=["POST"])
 @login_required
 def recycle_empty():
-    items = (
-        Bookmark.query.filter_by(user_id=current_user.id)
+    item_ids = [
+        row.id
+        for row in db.session.query(Bookmark.id)
+        .filter(Bookmark.user_id == current_user.id)
         .filter(Bookmark.deleted_at.is_not(None))
         .all()
-    )
-    purged = 0
-    for item in items:
-        if item.content:
-            db.session.delete(item.content)
-        item.tags.clear()
-        log_sync_event(current_user.id, "bookmark", item.id, "purge", {"id": item.id})
-        db.session.delete(item)
-        purged += 1
+    ]
+    for item_id in item_ids:
+        log_sync_event(current_user.id, "bookmark", item_id, "purge", {"id": item_id})
+    purge_bookmark_rows(item_ids)
+    purged = len(item_ids)
 
     db.session.commit()
 
@@ -1344,7 +1354,7 @@ def import_bookmarks():
                 active_job=active_job,
             )
 
-        html = upload.read().decode("utf-8", errors="ignore")
+        path = spool_import_upload(upload)
         job = ImportJob(user_id=current_user.id, status="pending", progress=0)
         db.session.add(job)
         db.session.commit()
@@ -1352,7 +1362,7 @@ def import_bookmarks():
             app=current_app._get_current_object(),
             user_id=current_user.id,
             job_id=job.id,
-            html=html,
+            path=path,
         )
 
         if request.headers.get("X-Requested-With") == "XMLHttpRequest":
@@ -1425,7 +1435,7 @@ def dead_links():
     items = (
         Bookmark.query.filter_by(user_id=current_user.id)
         .filter(Bookmark.deleted_at.is_(None))
-        .filter(Bookmark.link_status.in_(list(PROBLEMATIC_RESULTS)))
+        .filter(Bookmark.link_status.in_(PROBLEMATIC_RESULT_VALUES))
         .order_by(Bookmark.last_checked_at.desc())
         .all()
     )
@@ -1535,13 +1545,15 @@ def dead_links_delete_all():
     items = (
         Bookmark.query.filter_by(user_id=current_user.id)
         .filter(Bookmark.deleted_at.is_(None))
-        .filter(Bookmark.link_status.in_(list(PROBLEMATIC_RESULTS)))
+        .filter(Bookmark.link_status.in_(PROBLEMATIC_RESULT_VALUES))
+        .options(selectinload(Bookmark.tags))
         .all()
     )
 
     deleted_count = 0
+    now = utcnow()
     for item in items:
-        item.deleted_at = utcnow()
+        item.deleted_at = now
         item.deleted_by = current_user.id
         log_sync_event(
             current_user.id,
@@ -1581,14 +1593,16 @@ def dead_links_delete_selected():
     rows = (
         Bookmark.query.filter_by(user_id=current_user.id)
         .filter(Bookmark.deleted_at.is_(None))
-        .filter(Bookmark.link_status.in_(list(PROBLEMATIC_RESULTS)))
+        .filter(Bookmark.link_status.in_(PROBLEMATIC_RESULT_VALUES))
         .filter(Bookmark.id.in_(bookmark_ids))
+        .options(selectinload(Bookmark.tags))
         .all()
     )
 
     deleted_count = 0
+    now = utcnow()
     for item in rows:
-        item.deleted_at = utcnow()
+        item.deleted_at = now
         item.deleted_by = current_user.id
         log_sync_event(
             current_user.id,
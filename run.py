@@ -16,7 +16,6 @@ def main() -> None:
     p.add_argument("--port", type=int, default=8072)
     args = p.parse_args()
 
-    app = create_app()
     print(f"LinkLoom starting on http://{args.host}:{args.port}", flush=True)
     app.run(host=args.host, port=args.port, debug=False)
 
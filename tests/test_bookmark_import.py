@@ -1,4 +1,6 @@
-from app.services.bookmark_import import parse_bookmark_html
+import io
+
+from app.services.bookmark_import import iter_bookmark_html, parse_bookmark_html
 
 
 def test_parse_bookmark_html_handles_nested_netscape_structure():
@@ -45,3 +47,25 @@ def test_parse_bookmark_html_keeps_empty_title_when_anchor_has_no_text():
     assert len(rows) == 1
     assert rows[0].url == "https://example.com/no-title"
     assert rows[0].title == ""
+
+
+def test_iter_bookmark_html_streams_small_chunks_and_skips_invalid_bytes(monkeypatch):
+    monkeypatch.setattr("app.services.bookmark_import._READ_CHUNK_BYTES", 7)
+    html = (
+        b"<DL><p>\n"
+        b"  <DT><A HREF=\"https://example.com/first\">Caf\xc3\xa9 \xff</A>\n"
+        b"  <DT><H3>Later Folder</H3>\n"
+        b"  <DL><p>\n"
+        b"    <DT><A HREF=\"https://example.com/nested\">Nested</A>\n"
+        b"  </DL><p>\n"
+        b"  <DT><A HREF=\"https://example.com/last\">Last</A>\n"
+        b"</DL><p>\n"
+    )
+
+    rows = list(iter_bookmark_html(io.BytesIO(html)))
+    assert [(row.url, row.folder_path) for row in rows] == [
+        ("https://example.com/first", []),
+        ("https://example.com/nested", ["Later Folder"]),
+        ("https://example.com/last", []),
+    ]
+    assert rows[0].title == "Café"
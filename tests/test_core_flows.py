@@ -1,10 +1,11 @@
 import io
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from sqlalchemy import text
 
 from app.extensions import db
 from app.models import (
+    ApiToken,
     Bookmark,
     BookmarkContent,
     DeadLinkJob,
@@ -15,6 +16,7 @@ from app.models import (
     User,
     utcnow,
 )
+from app.services.common import normalize_url
 from app.services.content import ExtractedContent, LinkCheckResult, classify_status
 from app.services.sync import (
     SYNC_CONFIRM_PHRASES,
@@ -85,6 +87,29 @@ def test_admin_only_user_creation(client, app):
     assert response.status_code == 201
 
 
+def test_api_token_last_used_at_is_refreshed_at_most_once_per_minute(client, app):
+    with app.app_context():
+        _create_user("token-last-used", "secret")
+    token = _token(client, "token-last-used", "secret")
+    auth = {"Authorization": f"Bearer {token}"}
+
+    assert client.get("/api/v1/bookmarks", headers=auth).status_code == 200
+    with app.app_context():
+        first_used_at = ApiToken.query.one().last_used_at
+        assert first_used_at is not None
+
+    assert client.get("/api/v1/bookmarks", headers=auth).status_code == 200
+    with app.app_context():
+        row = ApiToken.query.one()
+        assert row.last_used_at == first_used_at
+        row.last_used_at = first_used_at - timedelta(minutes=2)
+        db.session.commit()
+
+    assert client.get("/api/v1/bookmarks", headers=auth).status_code == 200
+    with app.app_context():
+        assert ApiToken.query.one().last_used_at > first_used_at - timedelta(minutes=2)
+
+
 def test_recycle_restore_purge_flow(client, app):
     with app.app_context():
         _create_user("u1", "secret")
@@ -140,6 +165,106 @@ def test_api_bookmark_notes_none_serializes_as_empty_string(client, app):
     assert payload["notes"] == ""
 
 
+def test_api_bookmark_tags_reuse_existing_rows(client, app):
+    with app.app_context():
+        _create_user("tags-api", "secret")
+    token = _token(client, "tags-api", "secret")
+    auth = {"Authorization": f"Bearer {token}"}
+
+    response = client.post(
+        "/api/v1/bookmarks",
+        headers=auth,
+        json={
+            "url": "https://tags-one.example",
+            "tags": ["Python", "docs"],
+            "fetch_content": False,
+        },
+    )
+    assert response.status_code == 201
+    assert sorted(response.get_json()["tags"]) == ["docs", "python"]
+
+    response = client.post(
+        "/api/v1/bookmarks",
+        headers=auth,
+        json={
+            "url": "https://tags-two.example",
+            "tags": "python; new",
+            "fetch_content": False,
+        },
+    )
+    assert response.status_code == 201
+    assert sorted(response.get_json()["tags"]) == ["new", "python"]
+
+    with app.app_context():
+        names = sorted(tag.name for tag in Tag.query.all())
+        assert names == ["docs", "new", "python"]
+
+
+def test_api_search_ranks_active_bookmarks_by_title_tags_and_content(client, app):
+    with app.app_context():
+        user = _create_user("search-api", "secret")
+        other = _create_user("search-api-other", "secret")
+        tag = Tag(user_id=user.id, name="python")
+        db.session.add_all(
+            [
+                Bookmark(
+                    user_id=user.id,
+                    url="https://title.example",
+                    normalized_url="https://title.example/",
+                    title="Python",
+                ),
+                Bookmark(
+                    user_id=user.id,
+                    url="https://tagged.example",
+                    normalized_url="https://tagged.example/",
+                    title="Tagged",
+                    tags=[tag],
+                ),
+                Bookmark(
+                    user_id=user.id,
+                    url="https://content.example",
+                    normalized_url="https://content.example/",
+                    title="Reading",
+                    content=BookmarkContent(extracted_text="all about python"),
+                ),
+                Bookmark(
+                    user_id=user.id,
+                    url="https://deleted.example",
+                    normalized_url="https://deleted.example/",
+                    title="Python deleted",
+                    deleted_at=utcnow(),
+                ),
+                Bookmark(
+                    user_id=other.id,
+                    url="https://other.example",
+                    normalized_url="https://other.example/",
+                    title="Python elsewhere",
+                ),
+                Bookmark(
+                    user_id=user.id,
+                    url="https://garden.example",
+                    normalized_url="https://garden.example/",
+                    title="Gardening",
+                ),
+            ]
+        )
+        db.session.commit()
+
+    token = _token(client, "search-api", "secret")
+    response = client.get(
+        "/api/v1/search?q=python", headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == 200
+    items = response.get_json()["items"]
+    assert [item["url"] for item in items] == [
+        "https://title.example",
+        "https://tagged.example",
+        "https://content.example",
+    ]
+    assert items[1]["tags"] == ["python"]
+    assert "content_contains" in items[2]["match_reasons"]
+
+
 def test_sync_first_apply_requires_confirmation(client, app):
     with app.app_context():
         user = _create_user("syncuser", "secret")
@@ -287,6 +412,48 @@ def test_sync_first_replace_server_noops_when_local_empty(client, app):
     assert result["reason"] == "local_empty"
 
 
+def test_sync_first_two_way_preflight_counts_overlap(client, app):
+    with app.app_context():
+        user = _create_user("two-way-preflight", "secret")
+        for url in [
+            "https://shared.example",
+            "https://shared.example",
+            "https://server-only.example",
+        ]:
+            db.session.add(
+                Bookmark(user_id=user.id, url=url, normalized_url=f"{url}/")
+            )
+        db.session.add(
+            Bookmark(
+                user_id=user.id,
+                url="https://deleted.example",
+                normalized_url="https://deleted.example/",
+                deleted_at=datetime.now(timezone.utc),
+            )
+        )
+        db.session.commit()
+
+    token = _token(client, "two-way-preflight", "secret")
+    preflight = client.post(
+        "/api/v1/sync/first/preflight",
+        headers={"Authorization": f"Bearer {token}"},
+        json={
+            "client_id": "firefox-two-way-preflight",
+            "mode": SYNC_MODE_TWO_WAY,
+            "local_bookmarks": [
+                {"title": "Shared", "url": "https://shared.example"},
+                {"title": "Local", "url": "https://local-only.example"},
+            ],
+        },
+    )
+    assert preflight.status_code == 200
+    payload = preflight.get_json()
+    assert payload["server_bookmark_count"] == 3
+    assert payload["impact"]["matched"] == 1
+    assert payload["impact"]["server_additions"] == 1
+    assert payload["impact"]["local_additions"] == 2
+
+
 def test_sync_first_replace_local_snapshot_preserves_created_order(client, app):
     folder_id = None
     with app.app_context():
@@ -401,6 +568,48 @@ def test_sync_push_supports_folder_create_operations(client, app):
     assert any(event["entity_type"] == "folder" for event in events)
 
 
+def test_api_folder_delete_detaches_bookmarks_and_children(client, app):
+    with app.app_context():
+        user = _create_user("folder-delete-api", "secret")
+        parent = Folder(user_id=user.id, name="Parent")
+        db.session.add(parent)
+        db.session.flush()
+        child = Folder(user_id=user.id, name="Child", parent_id=parent.id)
+        bookmark = Bookmark(
+            user_id=user.id,
+            folder_id=parent.id,
+            url="https://folder-delete.example",
+            normalized_url="https://folder-delete.example/",
+            tags=[Tag(user_id=user.id, name="kept")],
+        )
+        db.session.add_all([child, bookmark])
+        db.session.commit()
+        parent_id = parent.id
+        child_id = child.id
+        bookmark_id = bookmark.id
+
+    token = _token(client, "folder-delete-api", "secret")
+    auth = {"Authorization": f"Bearer {token}"}
+    response = client.delete(f"/api/v1/folders/{parent_id}", headers=auth)
+    assert response.status_code == 200
+
+    with app.app_context():
+        assert db.session.get(Folder, parent_id) is None
+        assert db.session.get(Folder, child_id).parent_id is None
+        assert db.session.get(Bookmark, bookmark_id).folder_id is None
+
+    pull_response = client.get("/api/v1/sync/pull?since=0", headers=auth)
+    events = {
+        (event["entity_type"], event["entity_id"], event["action"]): event
+        for event in pull_response.get_json()["events"]
+    }
+    bookmark_event = events[("bookmark", bookmark_id, "update")]
+    assert bookmark_event["payload"]["folder_id"] is None
+    assert bookmark_event["payload"]["tags"] == ["kept"]
+    assert events[("folder", child_id, "update")]["payload"]["parent_id"] is None
+    assert ("folder", parent_id, "delete") in events
+
+
 def test_sync_first_replace_server_creates_immediately_and_starts_background_fetch(
     client, app, monkeypatch
 ):
@@ -475,6 +684,115 @@ def test_sync_first_replace_server_creates_immediately_and_starts_background_fet
         assert started["bookmark_ids"] == [bookmark.id]
 
 
+def test_sync_first_replace_server_replaces_existing_tree(client, app, monkeypatch):
+    with app.app_context():
+        user = _create_user("sync-replace-tree", "secret")
+        parent = Folder(user_id=user.id, name="Old Parent")
+        db.session.add(parent)
+        db.session.flush()
+        child = Folder(user_id=user.id, name="Old Child", parent_id=parent.id)
+        db.session.add(child)
+        db.session.flush()
+        old_bookmark = Bookmark(
+            user_id=user.id,
+            folder_id=child.id,
+            url="https://old-tree.example",
+            normalized_url="https://old-tree.example/",
+            title="Old",
+        )
+        db.session.add(old_bookmark)
+        db.session.commit()
+        old_folder_ids = {parent.id, child.id}
+        old_bookmark_id = old_bookmark.id
+
+    monkeypatch.setattr(
+        "app.api.routes.start_sync_first_replace_server_enrichment",
+        lambda **_kwargs: None,
+    )
+    token = _token(client, "sync-replace-tree", "secret")
+    auth = {"Authorization": f"Bearer {token}"}
+    local_folders = [
+        {"id": "f-root", "title": "New Root"},
+        {"id": "f-leaf", "title": "New Leaf", "parent_id": "f-root"},
+    ]
+    local_bookmarks = [
+        {
+            "id": "b-1",
+            "title": "New",
+            "url": "https://new-tree.example",
+            "folder_local_id": "f-leaf",
+        }
+    ]
+
+    preflight = client.post(
+        "/api/v1/sync/first/preflight",
+        headers=auth,
+        json={
+            "client_id": "firefox-replace-tree",
+            "mode": SYNC_MODE_REPLACE_SERVER,
+            "local_bookmarks": local_bookmarks,
+            "local_folders": local_folders,
+        },
+    )
+    assert preflight.status_code == 200
+
+    apply_response = client.post(
+        "/api/v1/sync/first/apply",
+        headers=auth,
+        json={
+            "client_id": "firefox-replace-tree",
+            "mode": SYNC_MODE_REPLACE_SERVER,
+            "confirmation_token": preflight.get_json()["confirmation_token"],
+            "typed_phrase": SYNC_CONFIRM_PHRASES[SYNC_MODE_REPLACE_SERVER],
+            "confirm_checked": True,
+            "local_bookmarks": local_bookmarks,
+            "local_folders": local_folders,
+        },
+    )
+    assert apply_response.status_code == 200
+    payload = apply_response.get_json()
+    assert payload["counts"] == {
+        "server_deleted": 1,
+        "folders_deleted": 2,
+        "server_created": 1,
+    }
+    folder_map = payload["mapping"]["local_folder_id_to_server_id"]
+    assert sorted(folder_map) == ["f-leaf", "f-root"]
+
+    with app.app_context():
+        folders = {folder.id: folder for folder in Folder.query.all()}
+        assert sorted(folder.name for folder in folders.values()) == [
+            "New Leaf",
+            "New Root",
+        ]
+        assert folders[folder_map["f-leaf"]].parent_id == folder_map["f-root"]
+
+        old_bookmark = db.session.get(Bookmark, old_bookmark_id)
+        assert old_bookmark.deleted_at is not None
+        assert old_bookmark.folder_id is None
+
+        new_bookmark = Bookmark.query.filter_by(url="https://new-tree.example").one()
+        assert new_bookmark.folder_id == folder_map["f-leaf"]
+
+    pull_response = client.get("/api/v1/sync/pull?since=0", headers=auth)
+    events = pull_response.get_json()["events"]
+    deleted_folder_ids = {
+        event["entity_id"]
+        for event in events
+        if event["entity_type"] == "folder" and event["action"] == "delete"
+    }
+    assert deleted_folder_ids == old_folder_ids
+    bookmark_deletes = [
+        event
+        for event in events
+        if event["entity_type"] == "bookmark"
+        and event["action"] == "delete"
+        and event["entity_id"] == old_bookmark_id
+    ]
+    assert len(bookmark_deletes) == 1
+    assert bookmark_deletes[0]["payload"]["deleted_at"] is not None
+
+
 def test_sync_replace_server_enrichment_worker_populates_notes_and_status(
     app, monkeypatch
 ):
@@ -649,6 +967,67 @@ def test_sync_first_two_way_merge_keeps_existing_notes_for_duplicate_urls(client
         assert bookmark.notes == "Existing indexed notes"
 
 
+def test_sync_first_two_way_merge_fetches_content_for_created_bookmarks(
+    client, app, monkeypatch
+):
+    with app.app_context():
+        _create_user("sync-merge-fetch", "secret")
+
+    def _fake_fetch(url, **_kwargs):
+        return ExtractedContent(
+            title=None,
+            text=f"Text for {url}",
+            status="alive",
+            error=None,
+            status_code=200,
+            final_url=url,
+        )
+
+    monkeypatch.setattr("app.api.routes.fetch_and_extract", _fake_fetch)
+    token = _token(client, "sync-merge-fetch", "secret")
+    auth = {"Authorization": f"Bearer {token}"}
+    local_bookmarks = [
+        {"id": "new-1", "title": "One", "url": "https://merge-one.example"},
+        {"id": "new-2", "title": "Two", "url": "https://merge-two.example"},
+    ]
+
+    preflight = client.post(
+        "/api/v1/sync/first/preflight",
+        headers=auth,
+        json={
+            "client_id": "firefox-merge-fetch",
+            "mode": SYNC_MODE_TWO_WAY,
+            "local_bookmarks": local_bookmarks,
+        },
+    )
+    assert preflight.status_code == 200
+
+    apply_response = client.post(
+        "/api/v1/sync/first/apply",
+        headers=auth,
+        json={
+            "client_id": "firefox-merge-fetch",
+            "mode": SYNC_MODE_TWO_WAY,
+            "confirmation_token": preflight.get_json()["confirmation_token"],
+            "typed_phrase": SYNC_CONFIRM_PHRASES[SYNC_MODE_TWO_WAY],
+            "confirm_checked": True,
+            "local_bookmarks": local_bookmarks,
+        },
+    )
+    assert apply_response.status_code == 200
+    payload = apply_response.get_json()
+    assert payload["counts"]["server_created"] == 2
+    notes_by_url = {row["url"]: row["notes"] for row in payload["bookmarks"]}
+    assert notes_by_url == {
+        "https://merge-one.example": "Text for https://merge-one.example",
+        "https://merge-two.example": "Text for https://merge-two.example",
+    }
+
+    with app.app_context():
+        rows = BookmarkContent.query.all()
+        assert sorted(row.fetch_status for row in rows) == ["alive", "alive"]
+
+
 def test_sync_push_create_skips_existing_bookmark_without_clearing_notes(client, app):
     with app.app_context():
         user = _create_user("sync-push-dup", "secret")
@@ -813,6 +1192,36 @@ def test_dead_links_recheck_selected_starts_job_for_selected_ids(
     assert started["bookmark_ids"] == selected_ids
 
 
+def test_shared_http_client_does_not_keep_cookies(monkeypatch):
+    import httpx
+
+    from app.services import content
+
+    sent_cookies = []
+
+    def _handler(request):
+        sent_cookies.append(request.headers.get("cookie"))
+        return httpx.Response(
+            200,
+            headers={"Set-Cookie": "session=abc; Path=/"},
+            html="<html><body>ok</body></html>",
+        )
+
+    client_class = httpx.Client
+    transport = httpx.MockTransport(_handler)
+    monkeypatch.setattr(content, "_http_client", None)
+    monkeypatch.setattr(
+        content.httpx,
+        "Client",
+        lambda **kwargs: client_class(transport=transport, **kwargs),
+    )
+
+    content.fetch_html("https://cookies.example/a", timeout=5, max_bytes=1000)
+    content.fetch_html("https://cookies.example/b", timeout=5, max_bytes=1000)
+
+    assert sent_cookies == [None, None]
+
+
 def test_dead_link_status_rules():
     assert classify_status(None, "Name or service not known") == "dns_error"
     assert classify_status(None, "operation timed out") == "timeout"
@@ -877,6 +1286,294 @@ def test_dead_link_job_populates_notes_and_content_text(app, monkeypatch):
         assert checks[0].result_type == "alive"
 
 
+def test_dead_link_job_clears_placeholder_notes_without_loading_notes(
+    app, monkeypatch
+):
+    from sqlalchemy import event
+
+    with app.app_context():
+        user = _create_user("dead-link-placeholder", "secret")
+        for idx, notes in enumerate(["None", "Keep these notes"]):
+            db.session.add(
+                Bookmark(
+                    user_id=user.id,
+                    url=f"https://placeholder.example/{idx}",
+                    normalized_url=f"https://placeholder.example/{idx}",
+                    notes=notes,
+                )
+            )
+        job = DeadLinkJob(user_id=user.id, status="pending", progress=0)
+        db.session.add(job)
+        db.session.commit()
+        user_id = user.id
+        job_id = job.id
+        engine = db.engine
+
+    monkeypatch.setattr(
+        "app.services.dead_link_jobs.fetch_and_extract",
+        lambda url, **_kwargs: ExtractedContent(
+            title=None,
+            text="",
+            status="alive",
+            error=None,
+            status_code=200,
+            final_url=url,
+        ),
+    )
+    statements = []
+
+    def _record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        from app.services.dead_link_jobs import _run_dead_link_job
+
+        _run_dead_link_job(app, user_id, job_id)
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert not any(
+        statement.startswith("SELECT bookmarks.notes") for statement in statements
+    )
+    with app.app_context():
+        notes = {
+            bookmark.url: bookmark.notes
+            for bookmark in Bookmark.query.filter_by(user_id=user_id)
+        }
+        assert notes == {
+            "https://placeholder.example/0": None,
+            "https://placeholder.example/1": "Keep these notes",
+        }
+
+
+def test_dead_link_job_stores_batches_under_one_savepoint(app, monkeypatch):
+    from sqlalchemy import event
+
+    from app.services import dead_link_jobs
+
+    with app.app_context():
+        user = _create_user("dead-link-savepoint", "secret")
+        for idx in range(3):
+            db.session.add(
+                Bookmark(
+                    user_id=user.id,
+                    url=f"https://savepoint.example/{idx}",
+                    normalized_url=f"https://savepoint.example/{idx}",
+                )
+            )
+        jobs = [DeadLinkJob(user_id=user.id, status="pending") for _ in range(2)]
+        db.session.add_all(jobs)
+        db.session.commit()
+        user_id = user.id
+        job_ids = [job.id for job in jobs]
+        engine = db.engine
+
+    monkeypatch.setattr(
+        "app.services.dead_link_jobs.fetch_and_extract",
+        lambda url, **_kwargs: ExtractedContent(
+            title=None,
+            text="Body",
+            status="alive",
+            error=None,
+            status_code=200,
+            final_url=url,
+        ),
+    )
+    savepoints = []
+
+    def _record(_conn, _cursor, statement, *_args):
+        if statement.startswith("SAVEPOINT"):
+            savepoints.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        dead_link_jobs._run_dead_link_job(app, user_id, job_ids[0])
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+    assert len(savepoints) == 1
+
+    store_check_result = dead_link_jobs._store_check_result
+
+    def _fail_one(target, extracted):
+        if target.url.endswith("/1"):
+            raise RuntimeError("cannot store")
+        return store_check_result(target, extracted)
+
+    monkeypatch.setattr("app.services.dead_link_jobs._store_check_result", _fail_one)
+    dead_link_jobs._run_dead_link_job(app, user_id, job_ids[1])
+
+    with app.app_context():
+        job = db.session.get(DeadLinkJob, job_ids[1])
+        assert job.status == "done"
+        assert (job.total_checked, job.total_alive) == (3, 2)
+        assert (job.total_problematic, job.total_errors) == (1, 1)
+        assert LinkCheck.query.count() == 5
+
+
+def test_dead_link_job_limits_busy_hosts_without_blocking_others(app, monkeypatch):
+    import threading
+
+    from app.services.dead_link_jobs import _run_dead_link_job
+
+    monkeypatch.setitem(app.config, "DEAD_LINK_WORKERS", 4)
+    monkeypatch.setitem(app.config, "DEAD_LINK_PER_HOST_LIMIT", 2)
+    busy_urls = [f"https://busy.example/{idx}" for idx in range(12)]
+    other_urls = [f"https://other-{idx}.example/" for idx in range(4)]
+    with app.app_context():
+        user = _create_user("dead-link-hosts", "secret")
+        for url in busy_urls + other_urls:
+            db.session.add(Bookmark(user_id=user.id, url=url, normalized_url=url))
+        job = DeadLinkJob(user_id=user.id, status="pending", progress=0)
+        db.session.add(job)
+        db.session.commit()
+        user_id = user.id
+        job_id = job.id
+
+    lock = threading.Lock()
+    others_fetched = threading.Event()
+    fetched_others = []
+    busy_active = [0, 0]
+    busy_timeouts = []
+
+    def _fetch(url, **_kwargs):
+        if url in other_urls:
+            with lock:
+                fetched_others.append(url)
+                if len(fetched_others) == len(other_urls):
+                    others_fetched.set()
+        else:
+            with lock:
+                busy_active[0] += 1
+                busy_active[1] = max(busy_active)
+            # Busy-host fetches hold until every other host has been fetched.
+            if not others_fetched.wait(timeout=2):
+                busy_timeouts.append(url)
+            with lock:
+                busy_active[0] -= 1
+        return ExtractedContent(
+            title=None,
+            text="Body",
+            status="alive",
+            error=None,
+            status_code=200,
+            final_url=url,
+        )
+
+    monkeypatch.setattr("app.services.dead_link_jobs.fetch_and_extract", _fetch)
+    _run_dead_link_job(app, user_id, job_id)
+
+    assert busy_timeouts == []
+    assert busy_active[1] == 2
+    with app.app_context():
+        job = db.session.get(DeadLinkJob, job_id)
+        assert job.status == "done"
+        assert job.total_checked == len(busy_urls) + len(other_urls)
+
+
+def test_dead_link_job_fetches_shared_urls_once(app, monkeypatch):
+    with app.app_context():
+        user = _create_user("dead-link-dupes", "secret")
+        bookmarks = [
+            Bookmark(
+                user_id=user.id,
+                url=url,
+                normalized_url=normalize_url(url),
+                title=url,
+            )
+            for url in (
+                "https://dupe.example/page?b=2&a=1",
+                "https://DUPE.example/page?a=1&b=2",
+                "https://other.example/",
+            )
+        ]
+        db.session.add_all(bookmarks)
+        db.session.flush()
+        job = DeadLinkJob(user_id=user.id, status="pending", progress=0)
+        db.session.add(job)
+        db.session.commit()
+        bookmark_ids = [bookmark.id for bookmark in bookmarks]
+        user_id = user.id
+        job_id = job.id
+
+    fetched_urls = []
+
+    def fake_fetch(url, **_kwargs):
+        fetched_urls.append(url)
+        return ExtractedContent(
+            title=None,
+            text=f"Text for {url}",
+            status="alive",
+            status_code=200,
+            final_url=url,
+        )
+
+    monkeypatch.setattr("app.services.dead_link_jobs.fetch_and_extract", fake_fetch)
+
+    from app.services.dead_link_jobs import _run_dead_link_job
+
+    _run_dead_link_job(app, user_id, job_id)
+
+    assert len(fetched_urls) == 2
+    with app.app_context():
+        job = db.session.get(DeadLinkJob, job_id)
+        assert job.status == "done"
+        assert job.total_targets == 3
+        assert job.total_checked == 3
+        assert job.progress == 100
+        for bookmark_id in bookmark_ids:
+            assert LinkCheck.query.filter_by(bookmark_id=bookmark_id).count() == 1
+            content = BookmarkContent.query.filter_by(bookmark_id=bookmark_id).one()
+            assert content.content_hash is not None
+
+
+def test_dead_link_job_marks_internal_bookmarks_without_fetching(app, monkeypatch):
+    with app.app_context():
+        user = _create_user("dead-link-internal", "secret")
+        internal_tag = Tag(user_id=user.id, name="internal")
+        internal = Bookmark(
+            user_id=user.id,
+            url="https://intranet.example",
+            normalized_url="https://intranet.example",
+            title="Intranet",
+            tags=[internal_tag],
+        )
+        external = Bookmark(
+            user_id=user.id,
+            url="https://public.example",
+            normalized_url="https://public.example",
+            title="Public",
+        )
+        job = DeadLinkJob(user_id=user.id, status="pending", progress=0)
+        db.session.add_all([internal, external, job])
+        db.session.commit()
+        internal_id = internal.id
+        external_id = external.id
+        user_id = user.id
+        job_id = job.id
+
+    fetched_urls = []
+
+    def fake_fetch(url, **_kwargs):
+        fetched_urls.append(url)
+        return ExtractedContent(title=None, text="", status="alive", status_code=200)
+
+    monkeypatch.setattr("app.services.dead_link_jobs.fetch_and_extract", fake_fetch)
+
+    from app.services.dead_link_jobs import _run_dead_link_job
+
+    _run_dead_link_job(app, user_id, job_id)
+
+    assert fetched_urls == ["https://public.example"]
+    with app.app_context():
+        internal = db.session.get(Bookmark, internal_id)
+        assert internal.link_status == "N/A"
+        assert internal.last_checked_at is not None
+        assert LinkCheck.query.filter_by(bookmark_id=internal_id).count() == 0
+        assert db.session.get(Bookmark, external_id).link_status == "alive"
+        assert db.session.get(DeadLinkJob, job_id).total_targets == 1
+
+
 def test_bookmark_status_filter_applies_to_html_and_live_routes(client, app):
     with app.app_context():
         user = _create_user("status-filter-user", "secret")
@@ -914,7 +1611,9 @@ def test_bookmark_status_filter_applies_to_html_and_live_routes(client, app):
     assert payload["items"][0]["title"] == "Alive Link"
 
 
-def test_import_job_keeps_empty_title_and_sets_checked_at(client, app, monkeypatch):
+def test_import_job_keeps_empty_title_and_sets_checked_at(
+    client, app, monkeypatch, tmp_path
+):
     with app.app_context():
         user = _create_user("import-job-user", "secret")
         job = ImportJob(user_id=user.id, status="pending", progress=0)
@@ -944,7 +1643,9 @@ def test_import_job_keeps_empty_title_and_sets_checked_at(client, app, monkeypat
 
     from app.services.import_jobs import _run_import_job
 
-    _run_import_job(app, user_id, job_id, html)
+    upload = tmp_path / "bookmarks.html"
+    upload.write_text(html, encoding="utf-8")
+    _run_import_job(app, user_id, job_id, str(upload))
 
     with app.app_context():
         bookmark = Bookmark.query.filter_by(user_id=user_id).first()
@@ -968,11 +1669,16 @@ def test_import_job_keeps_empty_title_and_sets_checked_at(client, app, monkeypat
 def test_api_import_keeps_empty_title_when_anchor_title_missing(
     client, app, monkeypatch
 ):
+    from app.services import import_jobs
+
     with app.app_context():
         _create_user("api-import-user", "secret")
 
     monkeypatch.setattr(
-        "app.api.routes.fetch_and_extract",
+        "app.api.routes.start_import_job", import_jobs._run_import_job
+    )
+    monkeypatch.setattr(
+        "app.services.import_jobs.fetch_and_extract",
         lambda *_args, **_kwargs: ExtractedContent(
             title="Fetched Title Should Not Override",
             text="Body",
@@ -997,7 +1703,15 @@ def test_api_import_keeps_empty_title_when_anchor_title_missing(
         data={"file": (io.BytesIO(html.encode("utf-8")), "bookmarks.html")},
         content_type="multipart/form-data",
     )
-    assert response.status_code == 200
+    assert response.status_code == 202
+    job_id = response.get_json()["job"]["id"]
+
+    status = client.get(
+        f"/api/v1/import/jobs/{job_id}",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert status.get_json()["status"] == "done"
+    assert status.get_json()["total_created"] == 1
 
     with app.app_context():
         bookmark = Bookmark.query.filter_by(
@@ -1006,6 +1720,65 @@ def test_api_import_keeps_empty_title_when_anchor_title_missing(
         assert bookmark is not None
         assert bookmark.title is None
         assert bookmark.last_checked_at is not None
+        assert bookmark.notes == "Body"
+
+
+def test_import_job_commits_progress_until_content_is_stored(
+    app, monkeypatch, tmp_path
+):
+    from app.services import import_jobs
+
+    with app.app_context():
+        user = _create_user("import-progress-user", "secret")
+        job = ImportJob(user_id=user.id, status="pending", progress=0)
+        db.session.add(job)
+        db.session.commit()
+        user_id = user.id
+        job_id = job.id
+
+    monkeypatch.setattr(
+        "app.services.import_jobs.fetch_and_extract",
+        lambda url, **_kwargs: ExtractedContent(
+            title=None,
+            text=f"Body of {url}",
+            status="alive",
+            error=None,
+            status_code=200,
+            final_url=url,
+        ),
+    )
+    committed = []
+    persist_progress = import_jobs._persist_progress
+
+    def _record_progress(job_id, **kwargs):
+        persist_progress(job_id, **kwargs)
+        job = db.session.get(ImportJob, job_id)
+        committed.append((job.status, job.progress))
+
+    monkeypatch.setattr(
+        "app.services.import_jobs._persist_progress", _record_progress
+    )
+
+    html = """
+<!DOCTYPE NETSCAPE-Bookmark-file-1>
+<DL><p>
+  <DT><A HREF="https://example.com/progress-1">One</A>
+  <DT><A HREF="https://example.com/progress-2">Two</A>
+  <DT><A HREF="https://example.com/progress-3">Three</A>
+</DL><p>
+"""
+    upload = tmp_path / "bookmarks.html"
+    upload.write_text(html, encoding="utf-8")
+    import_jobs._run_import_job(app, user_id, job_id, str(upload))
+
+    assert not upload.exists()
+
+    assert committed == [("running", 33), ("running", 66), ("running", 100)]
+    with app.app_context():
+        assert db.session.get(ImportJob, job_id).status == "done"
+        bookmarks = Bookmark.query.filter_by(user_id=user_id).all()
+        assert len(bookmarks) == 3
+        assert all(bookmark.notes.startswith("Body of") for bookmark in bookmarks)
 
 
 def test_api_bulk_check_defaults_to_all_targets(client, app, monkeypatch):
@@ -1031,7 +1804,7 @@ def test_api_bulk_check_defaults_to_all_targets(client, app, monkeypatch):
             error=None,
         )
 
-    monkeypatch.setattr("app.api.routes.check_link", _fake_check_link)
+    monkeypatch.setattr("app.services.dead_link_jobs.check_link", _fake_check_link)
 
     token = _token(client, "bulk-checker", "secret")
     response = client.post(
@@ -1042,6 +1815,12 @@ def test_api_bulk_check_defaults_to_all_targets(client, app, monkeypatch):
     assert response.status_code == 200
     assert response.get_json()["checked"] == 130
 
+    with app.app_context():
+        checks = LinkCheck.query.all()
+        assert len(checks) == 130
+        assert {check.latency_ms for check in checks} == {25}
+        assert all(check.checked_at is not None for check in checks)
+
 
 def test_dead_link_job_delete_route_removes_history(client, app):
     with app.app_context():
@@ -1634,6 +2413,8 @@ def test_keywords_schema_migration_moves_values_to_tags(app):
             normalized_url="https://migrate.example",
             title="Migrate",
         )
+        python_tag = Tag(user_id=user.id, name="python")
+        bookmark.tags.append(python_tag)
         db.session.add(bookmark)
         db.session.commit()
 
@@ -1650,12 +2431,26 @@ def test_keywords_schema_migration_moves_values_to_tags(app):
         bookmark = Bookmark.query.filter_by(id=bookmark.id).first()
         assert bookmark is not None
         assert sorted(tag.name for tag in bookmark.tags) == ["docs", "flask", "python"]
+        assert Tag.query.filter_by(user_id=user.id).count() == 3
 
         columns = db.session.execute(text("PRAGMA table_info(bookmarks)")).all()
         column_names = {row[1] for row in columns}
         assert "keywords_text" not in column_names
 
 
+def test_create_missing_indexes_adds_indexes_to_existing_tables(app):
+    with app.app_context():
+        from app.schema_migrations import create_missing_indexes
+
+        db.session.execute(text("DROP INDEX ix_bookmark_user_active_updated"))
+        db.session.commit()
+
+        assert create_missing_indexes() == ["ix_bookmark_user_active_updated"]
+        assert create_missing_indexes() == []
+        indexes = db.session.execute(text("PRAGMA index_list(bookmarks)")).all()
+        assert "ix_bookmark_user_active_updated" in {row[1] for row in indexes}
+
+
 def test_dead_links_delete_selected_only_deletes_problematic(client, app):
     with app.app_context():
         user = _create_user("dead-select-user", "secret")
@@ -1717,7 +2512,7 @@ def test_api_bulk_check_skips_internal_bookmark_and_sets_na(client, app, monkeyp
     def _fail_check(*_args, **_kwargs):
         raise AssertionError("check_link should not run for internal bookmarks")
 
-    monkeypatch.setattr("app.api.routes.check_link", _fail_check)
+    monkeypatch.setattr("app.services.dead_link_jobs.check_link", _fail_check)
     token = _token(client, "internal-api", "secret")
     response = client.post(
         "/api/v1/checks/run",